@@ -15,12 +15,12 @@ from src.disability_page import fill_disability_page
 LOG_DIR = 'logs/run_1'
 URL = "https://nvidia.wd5.myworkdayjobs.com/en-US/NVIDIAExternalCareerSite/job/US%2C-CA%2C-Santa-Clara/Senior-AI-and-ML-Engineer---AI-for-Networking_JR2000376/apply/applyManually?q=ml+enginer"
 
-async def main():
+async def main(user_choice: int = None):
     user_data = load_user_data('data/user_profile.json')
     os.makedirs(LOG_DIR, exist_ok=True)
     browser, page = await launch_browser(URL)
     try:
-        await signin_signup(page, user_data, f'{LOG_DIR}/page_1_signin_signup.json')
+        await signin_signup(page, user_data, f'{LOG_DIR}/page_1_signin_signup.json', user_choice)
         await fill_information_page(page, user_data, f'{LOG_DIR}/page_2_information.json')
         await fill_application_page(page, user_data, f'{LOG_DIR}/page_3_application.json')
         await fill_education_page(page, user_data, f'{LOG_DIR}/page_4_education.json')
@@ -33,4 +33,6 @@ async def main():
         await browser.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Ask before the event loop starts so the prompt doesn't block it
+    user_choice = int(input("Enter 1 for sign in or 2 for sign up: "))
+    asyncio.run(main(user_choice))
@@ -8,6 +8,7 @@ Author: Job Automation Team
 Date: July 23, 2025
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -82,6 +83,7 @@ class ApplicationConfig:
     PAGE_LOAD_TIMEOUT = 30000
     ELEMENT_WAIT_TIMEOUT = 10000
     FORM_SUBMISSION_DELAY = 2000
+    FORM_LOG_FSYNC_INTERVAL = 1000  # minimum time between form log fsyncs; 0 syncs every batch
     
     def __init__(self):
         """Initialize application configuration."""
@@ -135,5 +137,19 @@ class ApplicationConfig:
         return self.paths
 
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> ApplicationConfig:
+    """
+    Get the shared application configuration.
+    
+    The configuration is built once per process, so creating loggers and
+    other helpers does not repeat the path setup and directory creation.
+    
+    Returns:
+        The process-wide ApplicationConfig instance
+    """
+    return ApplicationConfig()
+
+
 # Legacy compatibility - maintain existing import structure
-START_URL = ApplicationConfig().get_target_url()
+START_URL = get_config().get_target_url()
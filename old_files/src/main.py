@@ -84,20 +84,24 @@ class JobApplicationAutomator:
         
         auth_handler = AuthenticationHandler(page, self.logger)
         
-        # Log initial page state
-        await auth_handler.log_initial_form_state(user_choice)
-        
-        # Execute authentication based on user choice
-        auth_success = await auth_handler.execute_authentication(
-            auth_type=user_choice,
-            email=credentials['email'],
-            password=credentials['password']
-        )
-        
-        # Log authentication result
-        await auth_handler.log_authentication_result(user_choice, auth_success)
-        
-        return auth_success
+        try:
+            # Log initial page state
+            await auth_handler.log_initial_form_state(user_choice)
+            
+            # Execute authentication based on user choice
+            auth_success = await auth_handler.execute_authentication(
+                auth_type=user_choice,
+                email=credentials['email'],
+                password=credentials['password']
+            )
+            
+            # Log authentication result
+            await auth_handler.log_authentication_result(user_choice, auth_success)
+            
+            return auth_success
+        finally:
+            # Form data records are written in the background; flush them before the handler goes away
+            await auth_handler.form_data_logger.close()
         
     async def execute_my_information_form_workflow(self, page: Page, user_data: Dict[str, Any]) -> bool:
         """
@@ -120,83 +124,87 @@ class JobApplicationAutomator:
         
         form_processor = FormProcessor(page, self.logger)
         
-        # TEMPORARY FIX: Check if name field is already filled and skip everything if so
-        self.logger.info("🔍 Checking if form is already filled...")
-        try:
-            name_field_selector = "#name--legalName--firstName"
-            name_field = await page.query_selector(name_field_selector)
-            if name_field:
-                current_name = await page.input_value(name_field_selector)
-                if current_name and current_name.strip():
-                    self.logger.success(f"✅ Form already filled with name: '{current_name.strip()}' - skipping to form processing")
-                    # Skip the dropdown handling and go straight to form processing
-                    await form_processor.log_initial_form_state("my_information_complete")
-                    form_success = await form_processor.process_personal_information_form(user_data)
-                    await form_processor.log_form_completion_result("my_information", form_success)
-                    return form_success
-        except Exception as e:
-            self.logger.warning(f"Error checking if form is filled, proceeding normally: {e}")
-        
-        # Handle cascading "How Did You Hear About Us?" dropdown
-        self.logger.info("Handling cascading 'How Did You Hear About Us?' dropdown...")
         try:
-            # Step 1: Click the search field to open first dropdown
-            how_did_you_hear_selector = "#source--source"
-            await page.click(how_did_you_hear_selector)
-            self.logger.info("✓ Successfully clicked 'How Did You Hear About Us?' field")
-            
-            # Wait for first dropdown to appear
-            await page.wait_for_timeout(3000)
-            
-            # Step 2: Click first dropdown option (e.g., "University")
-            self.logger.info("Clicking first dropdown option...")
-            first_option_clicked = await self._click_first_available_dropdown_option(page)
+            # TEMPORARY FIX: Check if name field is already filled and skip everything if so
+            self.logger.info("🔍 Checking if form is already filled...")
+            try:
+                name_field_selector = "#name--legalName--firstName"
+                name_field = await page.query_selector(name_field_selector)
+                if name_field:
+                    current_name = await page.input_value(name_field_selector)
+                    if current_name and current_name.strip():
+                        self.logger.success(f"✅ Form already filled with name: '{current_name.strip()}' - skipping to form processing")
+                        # Skip the dropdown handling and go straight to form processing
+                        await form_processor.log_initial_form_state("my_information_complete")
+                        form_success = await form_processor.process_personal_information_form(user_data)
+                        await form_processor.log_form_completion_result("my_information", form_success)
+                        return form_success
+            except Exception as e:
+                self.logger.warning(f"Error checking if form is filled, proceeding normally: {e}")
             
-            if first_option_clicked:
-                self.logger.info("✓ Successfully clicked first dropdown option")
+            # Handle cascading "How Did You Hear About Us?" dropdown
+            self.logger.info("Handling cascading 'How Did You Hear About Us?' dropdown...")
+            try:
+                # Step 1: Click the search field to open first dropdown
+                how_did_you_hear_selector = "#source--source"
+                await page.click(how_did_you_hear_selector)
+                self.logger.info("✓ Successfully clicked 'How Did You Hear About Us?' field")
                 
-                # Wait for second dropdown to appear
+                # Wait for first dropdown to appear
                 await page.wait_for_timeout(3000)
                 
-                # Step 3: Click second dropdown option if available
-                self.logger.info("Looking for and clicking second dropdown option...")
-                second_option_clicked = await self._click_second_dropdown_option(page)
+                # Step 2: Click first dropdown option (e.g., "University")
+                self.logger.info("Clicking first dropdown option...")
+                first_option_clicked = await self._click_first_available_dropdown_option(page)
                 
-                if second_option_clicked:
-                    self.logger.info("✓ Successfully clicked second dropdown option")
-                    # Wait for any additional elements to load
-                    await page.wait_for_timeout(2000)
+                if first_option_clicked:
+                    self.logger.info("✓ Successfully clicked first dropdown option")
+                    
+                    # Wait for second dropdown to appear
+                    await page.wait_for_timeout(3000)
+                    
+                    # Step 3: Click second dropdown option if available
+                    self.logger.info("Looking for and clicking second dropdown option...")
+                    second_option_clicked = await self._click_second_dropdown_option(page)
+                    
+                    if second_option_clicked:
+                        self.logger.info("✓ Successfully clicked second dropdown option")
+                        # Wait for any additional elements to load
+                        await page.wait_for_timeout(2000)
+                    else:
+                        self.logger.info("ℹ️ No second dropdown option found or needed")
                 else:
-                    self.logger.info("ℹ️ No second dropdown option found or needed")
-            else:
-                self.logger.warning("⚠️ Failed to click first dropdown option")
+                    self.logger.warning("⚠️ Failed to click first dropdown option")
+                
+                # Step 4: Extract ALL final form elements in ONE log
+                self.logger.info("Extracting complete form elements after dropdown interactions...")
+                await form_processor.log_initial_form_state("my_information_complete")
+                
+            except Exception as e:
+                self.logger.error(f"Failed to handle 'How Did You Hear About Us?' dropdown: {str(e)}")
+                return False
             
-            # Step 4: Extract ALL final form elements in ONE log
-            self.logger.info("Extracting complete form elements after dropdown interactions...")
-            await form_processor.log_initial_form_state("my_information_complete")
+            # Process personal information form with user data
+            self.logger.info("Processing personal information form with user data...")
+            try:
+                form_success = await form_processor.process_personal_information_form(user_data)
+                
+                if form_success:
+                    self.logger.success("✅ Personal information form processed successfully")
+                else:
+                    self.logger.warning("⚠️ Personal information form processing completed with some issues")
+                    
+            except Exception as e:
+                self.logger.error(f"Failed to process personal information form: {str(e)}")
+                form_success = False
             
-        except Exception as e:
-            self.logger.error(f"Failed to handle 'How Did You Hear About Us?' dropdown: {str(e)}")
-            return False
-        
-        # Process personal information form with user data
-        self.logger.info("Processing personal information form with user data...")
-        try:
-            form_success = await form_processor.process_personal_information_form(user_data)
+            # Log form completion result
+            await form_processor.log_form_completion_result("my_information", form_success)
             
-            if form_success:
-                self.logger.success("✅ Personal information form processed successfully")
-            else:
-                self.logger.warning("⚠️ Personal information form processing completed with some issues")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to process personal information form: {str(e)}")
-            form_success = False
-        
-        # Log form completion result
-        await form_processor.log_form_completion_result("my_information", form_success)
-        
-        return form_success
+            return form_success
+        finally:
+            # Form data records are written in the background; flush them before the processor goes away
+            await form_processor.form_data_logger.close()
         
     async def _click_first_available_dropdown_option(self, page: Page) -> bool:
         """
@@ -8,12 +8,408 @@ Author: Job Automation Team
 Date: July 23, 2025
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from collections import Counter
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from playwright.async_api import Page, Locator
 
 from src.utils.logger import ApplicationLogger
 
 
+# Attribute filters that drop obviously hidden nodes at query time; anything
+# these cannot catch (CSS classes, hidden ancestors) is left to the visibility check
+_NOT_HIDDEN = ':not([hidden]):not([style*="display: none"]):not([style*="display:none"])'
+
+
+def _exclude_hidden(*selectors: str) -> str:
+    """Join selectors into a selector list, excluding explicitly hidden nodes."""
+    return ', '.join(f'{selector}{_NOT_HIDDEN}' for selector in selectors)
+
+
+# CSS selectors for each extracted element type, shared by the bulk sweep and
+# the per-element fallback path
+_ELEMENT_SELECTORS = {
+    'input': _exclude_hidden('input:not([type="hidden"])'),
+    'button': _exclude_hidden('button', 'input[type="submit"]', 'input[type="button"]', 'div[role="button"]'),
+    'select': _exclude_hidden('select'),
+    'textarea': _exclude_hidden('textarea'),
+    'dropdown_option': _exclude_hidden(
+        'div[data-automation-id="promptLeafNode"]',
+        'div[data-automation-id="promptOption"]',
+        '[data-uxi-widget-type="multiselectlistitem"]'
+    ),
+}
+
+# Union of all element selectors, built once at import for the page fingerprint
+_COMBINED_ELEMENT_SELECTOR = ', '.join(_ELEMENT_SELECTORS.values())
+
+# Element types the fallback path reads one element at a time; dropdown options
+# are always built in bulk by _extract_dropdown_option_elements
+_PER_ELEMENT_SELECTORS = {
+    element_type: selector
+    for element_type, selector in _ELEMENT_SELECTORS.items()
+    if element_type != 'dropdown_option'
+}
+_COMBINED_PER_ELEMENT_SELECTOR = ', '.join(_PER_ELEMENT_SELECTORS.values())
+
+# Cheap page fingerprint used as the extraction cache key: URL, a per-document
+# id, a change counter and the number of extractable elements. The counter is
+# kept by a MutationObserver (DOM, attribute, class and style changes) plus
+# input/change listeners (value and checked changes, which don't mutate the
+# DOM); both are installed on the first call for each document.
+_PAGE_FINGERPRINT_JS = '''
+    selector => {
+        if (!window.__formExtractorChanges) {
+            const changes = window.__formExtractorChanges = {id: Math.random().toString(36).slice(2), count: 0};
+            const bump = () => { changes.count++; };
+            new MutationObserver(bump).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+            document.addEventListener('input', bump, true);
+            document.addEventListener('change', bump, true);
+        }
+        const changes = window.__formExtractorChanges;
+        return [
+            location.href,
+            changes.id,
+            changes.count,
+            document.querySelectorAll(selector).length
+        ].join('|');
+    }
+'''
+
+# Small in-page DOM helpers shared by the extraction scripts. isVisible uses the
+# same heuristic as Playwright's is_visible.
+_DOM_HELPERS_JS = '''
+        const attr = (el, name) => el.getAttribute(name) || '';
+        const flag = (el, name) => el.hasAttribute(name);
+        const text = el => el.textContent || '';
+
+        const isVisible = el => {
+            if (getComputedStyle(el).visibility === 'hidden') return false;
+            return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        };
+'''
+
+# Classifies every element of a combined query in one round-trip: visibility
+# plus each element type it matches, with its index among that type's matches
+_CLASSIFY_ELEMENTS_JS = '''
+    (els, selectors) => {
+''' + _DOM_HELPERS_JS + '''
+        const counters = {};
+        return els.map(el => {
+            const visible = isVisible(el);
+            const matches = [];
+            for (const [elementType, selector] of Object.entries(selectors)) {
+                if (el.matches(selector)) {
+                    counters[elementType] = counters[elementType] || 0;
+                    matches.push([elementType, counters[elementType]++]);
+                }
+            }
+            return {visible, matches};
+        });
+    }
+'''
+
+# In-page selector builders shared by the bulk sweep and the per-element
+# readers, so selector generation never costs an extra round-trip. Priority:
+# data-automation-id, id, tag[name], tag[type], tag.
+_SELECTOR_BUILDERS_JS = '''
+        const buildSelector = el => {
+            const automationId = el.getAttribute('data-automation-id');
+            if (automationId) return `[data-automation-id="${automationId}"]`;
+            const id = el.getAttribute('id');
+            if (id) return `#${id}`;
+            const tagName = el.tagName.toLowerCase();
+            const name = el.getAttribute('name');
+            if (name) return `${tagName}[name="${name}"]`;
+            const type = el.getAttribute('type');
+            return type ? `${tagName}[type="${type}"]` : tagName;
+        };
+
+        const buildDropdownOptionSelector = el => {
+            const automationId = el.getAttribute('data-automation-id');
+            if (automationId) return `[data-automation-id="${automationId}"]`;
+            const automationLabel = el.getAttribute('data-automation-label');
+            if (automationLabel) return `[data-automation-label="${automationLabel}"]`;
+            const multiselectId = el.getAttribute('data-uxi-multiselect-id');
+            const itemIndex = el.getAttribute('data-uxi-multiselectlistitem-index');
+            if (multiselectId && itemIndex) {
+                return `[data-uxi-multiselect-id="${multiselectId}"][data-uxi-multiselectlistitem-index="${itemIndex}"]`;
+            }
+            const id = el.getAttribute('id');
+            if (id) return `#${id}`;
+            const content = (el.textContent || '').trim();
+            if (content) return `text="${content}"`;
+            return 'div[data-automation-id="promptLeafNode"]';
+        };
+'''
+
+# In-page label resolver: aria-label, then label[for=id], then the nearest
+# ancestor <label>, then the placeholder.
+_LABEL_RESOLVER_JS = '''
+        const findLabel = el => {
+            const ariaLabel = el.getAttribute('aria-label');
+            if (ariaLabel) return ariaLabel;
+            const id = el.getAttribute('id');
+            if (id) {
+                const label = document.querySelector(`label[for="${CSS.escape(id)}"]`);
+                const labelText = label ? (label.textContent || '').trim() : '';
+                if (labelText) return labelText;
+            }
+            let parent = el.parentElement;
+            while (parent && parent.tagName !== 'BODY') {
+                if (parent.tagName === 'LABEL') {
+                    const parentText = (parent.textContent || '').trim();
+                    if (parentText) return parentText;
+                    break;
+                }
+                parent = parent.parentElement;
+            }
+            return el.getAttribute('placeholder') || 'Unknown';
+        };
+'''
+
+# In-page dropdown option record builder, shared by the page-wide sweep and the
+# dropdown option extraction. Text and automation attributes prefer the inner
+# promptOption element when there is one.
+_DROPDOWN_OPTION_RECORD_JS = '''
+        const buildDropdownOptionRecord = (el, index) => {
+            const source = el.querySelector('[data-automation-id="promptOption"]') || el;
+            const content = text(source).trim();
+            const automationLabel = attr(source, 'data-automation-label');
+            return {
+                element_type: 'dropdown_option',
+                index,
+                type_of_input: 'dropdown_option',
+                text: content,
+                label: automationLabel || content,
+                data_automation_id: attr(source, 'data-automation-id'),
+                data_automation_label: automationLabel,
+                selector: buildDropdownOptionSelector(el),
+                is_selected: el.getAttribute('data-uxi-multiselectlistitem-isselected') === 'true',
+                checked_state: attr(el, 'data-automation-checked'),
+                multiselect_id: attr(el, 'data-uxi-multiselect-id'),
+                item_index: attr(el, 'data-uxi-multiselectlistitem-index'),
+                class: attr(el, 'class'),
+                id: attr(el, 'id'),
+                tag_name: el.tagName.toLowerCase()
+            };
+        };
+'''
+
+# Dropdown options as finished records, built in one round-trip; hidden
+# options are skipped when visibleOnly is set
+_EXTRACT_DROPDOWN_OPTIONS_JS = '''
+    (els, visibleOnly) => {
+''' + _DOM_HELPERS_JS + _SELECTOR_BUILDERS_JS + _DROPDOWN_OPTION_RECORD_JS + '''
+        const records = [];
+        els.forEach((el, index) => {
+            if (!visibleOnly || isVisible(el)) records.push(buildDropdownOptionRecord(el, index));
+        });
+        return records;
+    }
+'''
+
+# Page-wide extraction sweep: walks the DOM once inside the browser and returns
+# fully populated element records (same shape as the _get_*_element_info helpers)
+# in a single round-trip.
+_EXTRACT_ALL_JS = '''
+    selectors => {
+''' + _DOM_HELPERS_JS + _SELECTOR_BUILDERS_JS + _LABEL_RESOLVER_JS + _DROPDOWN_OPTION_RECORD_JS + '''
+        const builders = {
+            input: (el, index) => ({
+                element_type: 'input',
+                index,
+                type_of_input: attr(el, 'type') || 'text',
+                name: attr(el, 'name'),
+                id: attr(el, 'id'),
+                id_of_input_component: attr(el, 'data-automation-id') || attr(el, 'id') || attr(el, 'name'),
+                placeholder: attr(el, 'placeholder'),
+                value: attr(el, 'value'),
+                required: flag(el, 'required'),
+                disabled: flag(el, 'disabled'),
+                readonly: flag(el, 'readonly'),
+                class: attr(el, 'class'),
+                selector: buildSelector(el),
+                label: findLabel(el),
+                aria_label: attr(el, 'aria-label'),
+                autocomplete: attr(el, 'autocomplete'),
+                data_automation_id: attr(el, 'data-automation-id')
+            }),
+            button: (el, index) => ({
+                element_type: 'button',
+                index,
+                type_of_input: attr(el, 'type') || 'button',
+                name: attr(el, 'name'),
+                id: attr(el, 'id'),
+                id_of_input_component: attr(el, 'data-automation-id') || attr(el, 'id') || attr(el, 'name'),
+                value: attr(el, 'value'),
+                text: text(el),
+                disabled: flag(el, 'disabled'),
+                class: attr(el, 'class'),
+                selector: buildSelector(el),
+                label: text(el) || attr(el, 'value') || attr(el, 'aria-label'),
+                aria_label: attr(el, 'aria-label'),
+                aria_haspopup: attr(el, 'aria-haspopup'),
+                data_automation_id: attr(el, 'data-automation-id'),
+                role: attr(el, 'role'),
+                tag_name: el.tagName.toLowerCase()
+            }),
+            select: (el, index) => ({
+                element_type: 'select',
+                index,
+                type_of_input: 'select',
+                name: attr(el, 'name'),
+                id: attr(el, 'id'),
+                required: flag(el, 'required'),
+                disabled: flag(el, 'disabled'),
+                multiple: flag(el, 'multiple'),
+                class: attr(el, 'class'),
+                selector: buildSelector(el),
+                label: findLabel(el),
+                aria_label: attr(el, 'aria-label'),
+                options: Array.from(el.options, option => ({
+                    value: attr(option, 'value'),
+                    text: text(option),
+                    selected: flag(option, 'selected')
+                }))
+            }),
+            textarea: (el, index) => ({
+                element_type: 'textarea',
+                index,
+                type_of_input: 'textarea',
+                name: attr(el, 'name'),
+                id: attr(el, 'id'),
+                placeholder: attr(el, 'placeholder'),
+                value: text(el),
+                required: flag(el, 'required'),
+                disabled: flag(el, 'disabled'),
+                readonly: flag(el, 'readonly'),
+                rows: attr(el, 'rows'),
+                cols: attr(el, 'cols'),
+                maxlength: attr(el, 'maxlength'),
+                class: attr(el, 'class'),
+                selector: buildSelector(el),
+                label: findLabel(el),
+                aria_label: attr(el, 'aria-label')
+            }),
+            dropdown_option: buildDropdownOptionRecord
+        };
+
+        // One walk over the combined selector: each element's visibility is
+        // computed once and it is built for every type it matches, keeping the
+        // per-type indices and grouping of a separate query per type
+        const entries = Object.entries(selectors);
+        const grouped = {};
+        const counters = {};
+        for (const [elementType] of entries) {
+            grouped[elementType] = [];
+            counters[elementType] = 0;
+        }
+
+        document.querySelectorAll(entries.map(([, selector]) => selector).join(', ')).forEach(el => {
+            let visible = null;
+            for (const [elementType, selector] of entries) {
+                if (!el.matches(selector)) continue;
+                const index = counters[elementType]++;
+                if (visible === null) visible = isVisible(el);
+                if (visible) grouped[elementType].push(builders[elementType](el, index));
+            }
+        });
+        return entries.flatMap(([elementType]) => grouped[elementType]);
+    }
+'''
+
+# In-page attribute readers: each returns every attribute an info builder needs,
+# including the generated selector and resolved label, in a single evaluate()
+# round-trip instead of one get_attribute() call per field.
+_INPUT_ATTRIBUTES_JS = '''
+    el => {
+''' + _SELECTOR_BUILDERS_JS + _LABEL_RESOLVER_JS + '''
+        return {
+            type: el.getAttribute('type'),
+            name: el.getAttribute('name'),
+            id: el.getAttribute('id'),
+            placeholder: el.getAttribute('placeholder'),
+            value: el.getAttribute('value'),
+            required: el.hasAttribute('required'),
+            disabled: el.hasAttribute('disabled'),
+            readonly: el.hasAttribute('readonly'),
+            className: el.getAttribute('class'),
+            ariaLabel: el.getAttribute('aria-label'),
+            autocomplete: el.getAttribute('autocomplete'),
+            dataAutomationId: el.getAttribute('data-automation-id'),
+            selector: buildSelector(el),
+            label: findLabel(el)
+        };
+    }
+'''
+
+_BUTTON_ATTRIBUTES_JS = '''
+    el => {
+''' + _SELECTOR_BUILDERS_JS + '''
+        return {
+            tagName: el.tagName.toLowerCase(),
+            type: el.getAttribute('type'),
+            name: el.getAttribute('name'),
+            id: el.getAttribute('id'),
+            value: el.getAttribute('value'),
+            text: el.textContent,
+            disabled: el.hasAttribute('disabled'),
+            className: el.getAttribute('class'),
+            ariaLabel: el.getAttribute('aria-label'),
+            ariaHaspopup: el.getAttribute('aria-haspopup'),
+            dataAutomationId: el.getAttribute('data-automation-id'),
+            role: el.getAttribute('role'),
+            selector: buildSelector(el)
+        };
+    }
+'''
+
+_SELECT_ATTRIBUTES_JS = '''
+    el => {
+''' + _SELECTOR_BUILDERS_JS + _LABEL_RESOLVER_JS + '''
+        return {
+            name: el.getAttribute('name'),
+            id: el.getAttribute('id'),
+            required: el.hasAttribute('required'),
+            disabled: el.hasAttribute('disabled'),
+            multiple: el.hasAttribute('multiple'),
+            className: el.getAttribute('class'),
+            ariaLabel: el.getAttribute('aria-label'),
+            selector: buildSelector(el),
+            label: findLabel(el),
+            options: Array.from(el.options, option => ({
+                value: option.getAttribute('value') || '',
+                text: option.textContent || '',
+                selected: option.hasAttribute('selected')
+            }))
+        };
+    }
+'''
+
+_TEXTAREA_ATTRIBUTES_JS = '''
+    el => {
+''' + _SELECTOR_BUILDERS_JS + _LABEL_RESOLVER_JS + '''
+        return {
+            name: el.getAttribute('name'),
+            id: el.getAttribute('id'),
+            placeholder: el.getAttribute('placeholder'),
+            text: el.textContent,
+            required: el.hasAttribute('required'),
+            disabled: el.hasAttribute('disabled'),
+            readonly: el.hasAttribute('readonly'),
+            rows: el.getAttribute('rows'),
+            cols: el.getAttribute('cols'),
+            maxlength: el.getAttribute('maxlength'),
+            className: el.getAttribute('class'),
+            ariaLabel: el.getAttribute('aria-label'),
+            selector: buildSelector(el),
+            label: findLabel(el)
+        };
+    }
+'''
+
+
 class FormExtractor:
     """
     Extracts and analyzes form elements from web pages.
@@ -32,173 +428,161 @@ class FormExtractor:
         """
         self.page = page
         self.logger = logger
+        
+        # Info builder per element type, built once rather than per dispatched element
+        self._info_builders = {
+            'input': self._get_input_element_info,
+            'button': self._get_button_element_info,
+            'select': self._get_select_element_info,
+            'textarea': self._get_textarea_element_info,
+        }
+        
+        # Callers waiting on the next extraction pass, and the task that runs it
+        self._pending_extractions: List[asyncio.Future] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Fingerprint of the last extracted page and its records; only the
+        # last page is kept so memory stays bounded
+        self._cached_fingerprint: Optional[str] = None
+        self._cached_elements: List[Dict[str, Any]] = []
     
     async def extract_all_form_elements(self) -> List[Dict[str, Any]]:
         """
         Extract all form elements from the current page.
         
+        Concurrent callers are coalesced: every call that arrives before the
+        next extraction pass starts shares the result of that single pass.
+        
+        Each caller gets its own list, but the element records are shared
+        with the extraction cache and must be treated as read-only.
+        
         Returns:
             List of dictionaries containing form element information
         """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._pending_extractions.append(waiter)
+        
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_extractions())
+        
+        return await waiter
+    
+    async def _flush_extractions(self):
+        """Run one extraction pass and hand its result to every queued caller."""
+        # Yield once so callers scheduled in the same loop iteration join this batch
+        await asyncio.sleep(0)
+        
+        waiters, self._pending_extractions = self._pending_extractions, []
+        self._flush_task = None
+        
+        form_elements = await self._extract_form_elements()
+        
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(list(form_elements))
+    
+    async def _extract_form_elements(self) -> List[Dict[str, Any]]:
+        """Extract all form elements from the current page in one pass."""
         try:
-            self.logger.debug("Starting form element extraction...")
+            # Replay the previous result if the page has not changed since
+            cache_key = await self.page.evaluate(_PAGE_FINGERPRINT_JS, _COMBINED_ELEMENT_SELECTOR)
+            if cache_key == self._cached_fingerprint:
+                self.logger.debug("Reusing cached form extraction", cache_key=cache_key)
+                return self._cached_elements
             
-            form_elements = []
+            self.logger.debug("Starting form element extraction...")
             
-            # Extract different types of form elements
-            input_elements = await self._extract_input_elements()
-            button_elements = await self._extract_button_elements()
-            select_elements = await self._extract_select_elements()
-            textarea_elements = await self._extract_textarea_elements()
-            dropdown_option_elements = await self._extract_dropdown_option_elements()
+            try:
+                # Single in-page sweep: one round-trip for the whole form
+                form_elements = await self.page.evaluate(_EXTRACT_ALL_JS, _ELEMENT_SELECTORS)
+            except Exception as e:
+                self.logger.warning("Bulk form extraction failed, falling back to per-element extraction", exception=e)
+                form_elements = await self._extract_elements_individually()
             
-            # Combine all elements
-            form_elements.extend(input_elements)
-            form_elements.extend(button_elements)
-            form_elements.extend(select_elements)
-            form_elements.extend(textarea_elements)
-            form_elements.extend(dropdown_option_elements)
+            element_counts = Counter(element['element_type'] for element in form_elements)
             
             self.logger.debug(
                 f"Form extraction completed",
                 total_elements=len(form_elements),
-                inputs=len(input_elements),
-                buttons=len(button_elements),
-                selects=len(select_elements),
-                textareas=len(textarea_elements),
-                dropdown_options=len(dropdown_option_elements)
+                inputs=element_counts['input'],
+                buttons=element_counts['button'],
+                selects=element_counts['select'],
+                textareas=element_counts['textarea'],
+                dropdown_options=element_counts['dropdown_option']
             )
             
+            self._cached_fingerprint = cache_key
+            self._cached_elements = form_elements
             return form_elements
             
         except Exception as e:
             self.logger.error("Failed to extract form elements", exception=e)
             return []
     
-    async def _extract_input_elements(self) -> List[Dict[str, Any]]:
-        """Extract input form elements."""
-        try:
-            input_elements = []
-            inputs = await self.page.query_selector_all('input')
-            
-            for i, input_element in enumerate(inputs):
-                try:
-                    # Skip hidden inputs
-                    if not await input_element.is_visible():
-                        continue
-                    
-                    element_info = await self._get_input_element_info(input_element, i)
-                    if element_info:
-                        input_elements.append(element_info)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing input element {i}", exception=e)
-                    continue
-            
-            return input_elements
-            
-        except Exception as e:
-            self.logger.error("Error extracting input elements", exception=e)
-            return []
-    
-    async def _extract_button_elements(self) -> List[Dict[str, Any]]:
-        """Extract button form elements."""
-        try:
-            button_elements = []
-            
-            # Get button elements, input[type=submit/button], and div[role=button]
-            buttons = await self.page.query_selector_all('button, input[type="submit"], input[type="button"], div[role="button"]')
-            
-            for i, button_element in enumerate(buttons):
-                try:
-                    if not await button_element.is_visible():
-                        continue
-                    
-                    element_info = await self._get_button_element_info(button_element, i)
-                    if element_info:
-                        button_elements.append(element_info)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing button element {i}", exception=e)
-                    continue
-            
-            return button_elements
-            
-        except Exception as e:
-            self.logger.error("Error extracting button elements", exception=e)
-            return []
+    async def _extract_elements_individually(self) -> List[Dict[str, Any]]:
+        """
+        Extract form elements one at a time (fallback for the bulk sweep).
+        
+        All extractable elements are classified with one combined locator in a
+        single round-trip that returns plain JSON; each visible element is then
+        dispatched to the info builder for every element type it matches. Elements
+        are addressed through lazy nth() locators, so no element handles are
+        pinned in the browser. Dropdown options are built in bulk alongside.
+        """
+        elements = self.page.locator(_COMBINED_PER_ELEMENT_SELECTOR)
+        classifications = await elements.evaluate_all(_CLASSIFY_ELEMENTS_JS, _PER_ELEMENT_SELECTORS)
+        
+        pending = []
+        for position, classification in enumerate(classifications):
+            if not classification['visible']:
+                continue
+            element = elements.nth(position)
+            for element_type, index in classification['matches']:
+                pending.append((element_type, self._dispatch(element_type)(element, index)))
+        
+        # Info builders are independent reads, so run them concurrently
+        *element_infos, dropdown_options = await asyncio.gather(
+            *(coroutine for _, coroutine in pending),
+            self._extract_dropdown_option_elements(visible_only=True)
+        )
+        
+        # Keep the per-type grouping of the sweep (all inputs, then buttons, ...)
+        grouped = {element_type: [] for element_type in _ELEMENT_SELECTORS}
+        for (element_type, _), element_info in zip(pending, element_infos):
+            if element_info:
+                grouped[element_type].append(element_info)
+        grouped['dropdown_option'] = dropdown_options
+        
+        return [element for group in grouped.values() for element in group]
     
-    async def _extract_select_elements(self) -> List[Dict[str, Any]]:
-        """Extract select dropdown elements."""
-        try:
-            select_elements = []
-            selects = await self.page.query_selector_all('select')
-            
-            for i, select_element in enumerate(selects):
-                try:
-                    if not await select_element.is_visible():
-                        continue
-                    
-                    element_info = await self._get_select_element_info(select_element, i)
-                    if element_info:
-                        select_elements.append(element_info)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing select element {i}", exception=e)
-                    continue
-            
-            return select_elements
-            
-        except Exception as e:
-            self.logger.error("Error extracting select elements", exception=e)
-            return []
-    
-    async def _extract_textarea_elements(self) -> List[Dict[str, Any]]:
-        """Extract textarea form elements."""
-        try:
-            textarea_elements = []
-            textareas = await self.page.query_selector_all('textarea')
-            
-            for i, textarea_element in enumerate(textareas):
-                try:
-                    if not await textarea_element.is_visible():
-                        continue
-                    
-                    element_info = await self._get_textarea_element_info(textarea_element, i)
-                    if element_info:
-                        textarea_elements.append(element_info)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing textarea element {i}", exception=e)
-                    continue
-            
-            return textarea_elements
-            
-        except Exception as e:
-            self.logger.error("Error extracting textarea elements", exception=e)
-            return []
+    def _dispatch(self, element_type: str) -> Callable[[Locator, int], Awaitable[Optional[Dict[str, Any]]]]:
+        """Return the info builder for an element type."""
+        return self._info_builders[element_type]
     
     async def _get_input_element_info(self, element: Locator, index: int) -> Optional[Dict[str, Any]]:
         """Get detailed information about an input element."""
         try:
+            attrs = await element.evaluate(_INPUT_ATTRIBUTES_JS)
+            
             element_info = {
                 'element_type': 'input',
                 'index': index,
-                'type_of_input': await element.get_attribute('type') or 'text',
-                'name': await element.get_attribute('name') or '',
-                'id': await element.get_attribute('id') or '',
-                'id_of_input_component': await element.get_attribute('data-automation-id') or await element.get_attribute('id') or await element.get_attribute('name') or '',
-                'placeholder': await element.get_attribute('placeholder') or '',
-                'value': await element.get_attribute('value') or '',
-                'required': await element.get_attribute('required') is not None,
-                'disabled': await element.get_attribute('disabled') is not None,
-                'readonly': await element.get_attribute('readonly') is not None,
-                'class': await element.get_attribute('class') or '',
-                'selector': await self._generate_selector(element),
-                'label': await self._find_associated_label(element),
-                'aria_label': await element.get_attribute('aria-label') or '',
-                'autocomplete': await element.get_attribute('autocomplete') or '',
-                'data_automation_id': await element.get_attribute('data-automation-id') or ''
+                'type_of_input': attrs['type'] or 'text',
+                'name': attrs['name'] or '',
+                'id': attrs['id'] or '',
+                'id_of_input_component': attrs['dataAutomationId'] or attrs['id'] or attrs['name'] or '',
+                'placeholder': attrs['placeholder'] or '',
+                'value': attrs['value'] or '',
+                'required': attrs['required'],
+                'disabled': attrs['disabled'],
+                'readonly': attrs['readonly'],
+                'class': attrs['className'] or '',
+                'selector': attrs['selector'],
+                'label': attrs['label'],
+                'aria_label': attrs['ariaLabel'] or '',
+                'autocomplete': attrs['autocomplete'] or '',
+                'data_automation_id': attrs['dataAutomationId'] or ''
             }
             
             return element_info
@@ -210,26 +594,26 @@ class FormExtractor:
     async def _get_button_element_info(self, element: Locator, index: int) -> Optional[Dict[str, Any]]:
         """Get detailed information about a button element."""
         try:
-            tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
+            attrs = await element.evaluate(_BUTTON_ATTRIBUTES_JS)
             
             element_info = {
                 'element_type': 'button',
                 'index': index,
-                'type_of_input': await element.get_attribute('type') or 'button',
-                'name': await element.get_attribute('name') or '',
-                'id': await element.get_attribute('id') or '',
-                'id_of_input_component': await element.get_attribute('data-automation-id') or await element.get_attribute('id') or await element.get_attribute('name') or '',
-                'value': await element.get_attribute('value') or '',
-                'text': await element.text_content() or '',
-                'disabled': await element.get_attribute('disabled') is not None,
-                'class': await element.get_attribute('class') or '',
-                'selector': await self._generate_selector(element),
-                'label': await element.text_content() or await element.get_attribute('value') or await element.get_attribute('aria-label') or '',
-                'aria_label': await element.get_attribute('aria-label') or '',
-                'aria_haspopup': await element.get_attribute('aria-haspopup') or '',
-                'data_automation_id': await element.get_attribute('data-automation-id') or '',
-                'role': await element.get_attribute('role') or '',
-                'tag_name': tag_name
+                'type_of_input': attrs['type'] or 'button',
+                'name': attrs['name'] or '',
+                'id': attrs['id'] or '',
+                'id_of_input_component': attrs['dataAutomationId'] or attrs['id'] or attrs['name'] or '',
+                'value': attrs['value'] or '',
+                'text': attrs['text'] or '',
+                'disabled': attrs['disabled'],
+                'class': attrs['className'] or '',
+                'selector': attrs['selector'],
+                'label': attrs['text'] or attrs['value'] or attrs['ariaLabel'] or '',
+                'aria_label': attrs['ariaLabel'] or '',
+                'aria_haspopup': attrs['ariaHaspopup'] or '',
+                'data_automation_id': attrs['dataAutomationId'] or '',
+                'role': attrs['role'] or '',
+                'tag_name': attrs['tagName']
             }
             
             return element_info
@@ -241,35 +625,22 @@ class FormExtractor:
     async def _get_select_element_info(self, element: Locator, index: int) -> Optional[Dict[str, Any]]:
         """Get detailed information about a select element."""
         try:
-            # Get options
-            options = await element.query_selector_all('option')
-            option_values = []
-            
-            for option in options:
-                try:
-                    option_info = {
-                        'value': await option.get_attribute('value') or '',
-                        'text': await option.text_content() or '',
-                        'selected': await option.get_attribute('selected') is not None
-                    }
-                    option_values.append(option_info)
-                except:
-                    continue
+            attrs = await element.evaluate(_SELECT_ATTRIBUTES_JS)
             
             element_info = {
                 'element_type': 'select',
                 'index': index,
                 'type_of_input': 'select',
-                'name': await element.get_attribute('name') or '',
-                'id': await element.get_attribute('id') or '',
-                'required': await element.get_attribute('required') is not None,
-                'disabled': await element.get_attribute('disabled') is not None,
-                'multiple': await element.get_attribute('multiple') is not None,
-                'class': await element.get_attribute('class') or '',
-                'selector': await self._generate_selector(element),
-                'label': await self._find_associated_label(element),
-                'aria_label': await element.get_attribute('aria-label') or '',
-                'options': option_values
+                'name': attrs['name'] or '',
+                'id': attrs['id'] or '',
+                'required': attrs['required'],
+                'disabled': attrs['disabled'],
+                'multiple': attrs['multiple'],
+                'class': attrs['className'] or '',
+                'selector': attrs['selector'],
+                'label': attrs['label'],
+                'aria_label': attrs['ariaLabel'] or '',
+                'options': attrs['options']
             }
             
             return element_info
@@ -281,24 +652,26 @@ class FormExtractor:
     async def _get_textarea_element_info(self, element: Locator, index: int) -> Optional[Dict[str, Any]]:
         """Get detailed information about a textarea element."""
         try:
+            attrs = await element.evaluate(_TEXTAREA_ATTRIBUTES_JS)
+            
             element_info = {
                 'element_type': 'textarea',
                 'index': index,
                 'type_of_input': 'textarea',
-                'name': await element.get_attribute('name') or '',
-                'id': await element.get_attribute('id') or '',
-                'placeholder': await element.get_attribute('placeholder') or '',
-                'value': await element.text_content() or '',
-                'required': await element.get_attribute('required') is not None,
-                'disabled': await element.get_attribute('disabled') is not None,
-                'readonly': await element.get_attribute('readonly') is not None,
-                'rows': await element.get_attribute('rows') or '',
-                'cols': await element.get_attribute('cols') or '',
-                'maxlength': await element.get_attribute('maxlength') or '',
-                'class': await element.get_attribute('class') or '',
-                'selector': await self._generate_selector(element),
-                'label': await self._find_associated_label(element),
-                'aria_label': await element.get_attribute('aria-label') or ''
+                'name': attrs['name'] or '',
+                'id': attrs['id'] or '',
+                'placeholder': attrs['placeholder'] or '',
+                'value': attrs['text'] or '',
+                'required': attrs['required'],
+                'disabled': attrs['disabled'],
+                'readonly': attrs['readonly'],
+                'rows': attrs['rows'] or '',
+                'cols': attrs['cols'] or '',
+                'maxlength': attrs['maxlength'] or '',
+                'class': attrs['className'] or '',
+                'selector': attrs['selector'],
+                'label': attrs['label'],
+                'aria_label': attrs['ariaLabel'] or ''
             }
             
             return element_info
@@ -306,115 +679,6 @@ class FormExtractor:
         except Exception as e:
             self.logger.warning(f"Error getting textarea element info for index {index}", exception=e)
             return None
-    
-    async def _generate_selector(self, element: Locator) -> str:
-        """Generate a reliable CSS selector for the element."""
-        try:
-            # Try data-automation-id first (most reliable for automation)
-            automation_id = await element.get_attribute('data-automation-id')
-            if automation_id:
-                return f'[data-automation-id="{automation_id}"]'
-            
-            # Try ID next
-            element_id = await element.get_attribute('id')
-            if element_id:
-                return f'#{element_id}'
-            
-            # Try name attribute
-            name = await element.get_attribute('name')
-            if name:
-                tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-                return f'{tag_name}[name="{name}"]'
-            
-            # Try a combination of tag and attributes
-            tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-            input_type = await element.get_attribute('type')
-            
-            if input_type:
-                return f'{tag_name}[type="{input_type}"]'
-            
-            # Fall back to tag name with index
-            return tag_name
-            
-        except Exception as e:
-            self.logger.warning("Error generating selector", exception=e)
-            return 'unknown'
-    
-    async def _find_associated_label(self, element: Locator) -> str:
-        """Find the label associated with this form element."""
-        try:
-            # Check for aria-label first
-            aria_label = await element.get_attribute('aria-label')
-            if aria_label:
-                return aria_label
-            
-            # Check for label element using 'for' attribute
-            element_id = await element.get_attribute('id')
-            if element_id:
-                label = await self.page.query_selector(f'label[for="{element_id}"]')
-                if label:
-                    label_text = await label.text_content()
-                    if label_text and label_text.strip():
-                        return label_text.strip()
-            
-            # Check for parent label
-            parent_label = await element.evaluate('''
-                element => {
-                    let parent = element.parentElement;
-                    while (parent && parent.tagName !== 'BODY') {
-                        if (parent.tagName === 'LABEL') {
-                            return parent.textContent;
-                        }
-                        parent = parent.parentElement;
-                    }
-                    return null;
-                }
-            ''')
-            
-            if parent_label and parent_label.strip():
-                return parent_label.strip()
-            
-            # Check placeholder as fallback
-            placeholder = await element.get_attribute('placeholder')
-            if placeholder:
-                return placeholder
-            
-            return 'Unknown'
-            
-        except Exception as e:
-            self.logger.warning("Error finding associated label", exception=e)
-            return 'Unknown'
-
-    async def _extract_dropdown_option_elements(self) -> List[Dict[str, Any]]:
-        """Extract dropdown option elements (like Workday dropdown options)."""
-        try:
-            dropdown_option_elements = []
-            
-            # Look for Workday-style dropdown options
-            dropdown_options = await self.page.query_selector_all(
-                'div[data-automation-id="promptLeafNode"], '
-                'div[data-automation-id="promptOption"], '
-                '[data-uxi-widget-type="multiselectlistitem"]'
-            )
-            
-            for i, option_element in enumerate(dropdown_options):
-                try:
-                    if not await option_element.is_visible():
-                        continue
-                    
-                    element_info = await self._get_dropdown_option_element_info(option_element, i)
-                    if element_info:
-                        dropdown_option_elements.append(element_info)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing dropdown option element {i}", exception=e)
-                    continue
-            
-            return dropdown_option_elements
-            
-        except Exception as e:
-            self.logger.error("Error extracting dropdown option elements", exception=e)
-            return []
 
     async def extract_visible_dropdown_options(self) -> List[Dict[str, Any]]:
         """
@@ -423,110 +687,31 @@ class FormExtractor:
         Returns:
             List of dictionaries containing visible dropdown option information
         """
-        try:
-            dropdown_option_elements = []
+        return await self._extract_dropdown_option_elements(visible_only=True)
+
+    async def _extract_dropdown_option_elements(self, visible_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Extract Workday-style dropdown options.
+        
+        Every option record (text, automation attributes, selection state and
+        selector) is built in the browser and returned by a single
+        eval_on_selector_all() round-trip, rather than one text_content() and
+        several get_attribute() calls per option.
+        
+        Args:
+            visible_only: Skip options that are not currently visible
             
-            # Look for currently visible Workday-style dropdown options
-            dropdown_options = await self.page.query_selector_all(
-                'div[data-automation-id="promptLeafNode"], '
-                'div[data-automation-id="promptOption"], '
-                '[data-uxi-widget-type="multiselectlistitem"]'
+        Returns:
+            List of dictionaries containing dropdown option information
+        """
+        try:
+            dropdown_option_elements = await self.page.eval_on_selector_all(
+                _ELEMENT_SELECTORS['dropdown_option'], _EXTRACT_DROPDOWN_OPTIONS_JS, visible_only
             )
             
-            for i, option_element in enumerate(dropdown_options):
-                try:
-                    # Only include if currently visible
-                    if await option_element.is_visible():
-                        element_info = await self._get_dropdown_option_element_info(option_element, i)
-                        if element_info:
-                            dropdown_option_elements.append(element_info)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error processing visible dropdown option element {i}", exception=e)
-                    continue
-            
-            self.logger.debug(f"Found {len(dropdown_option_elements)} visible dropdown options")
+            self.logger.debug(f"Found {len(dropdown_option_elements)} {'visible ' if visible_only else ''}dropdown options")
             return dropdown_option_elements
             
         except Exception as e:
-            self.logger.error("Error extracting visible dropdown option elements", exception=e)
+            self.logger.error("Error extracting dropdown option elements", exception=e)
             return []
-
-    async def _get_dropdown_option_element_info(self, element: Locator, index: int) -> Optional[Dict[str, Any]]:
-        """Get detailed information about a dropdown option element."""
-        try:
-            # Get the inner option element if it exists
-            inner_option = await element.query_selector('[data-automation-id="promptOption"]')
-            
-            # Get text content from either the inner option or the main element
-            text_content = ""
-            automation_label = ""
-            automation_id = ""
-            
-            if inner_option:
-                text_content = await inner_option.text_content() or ""
-                automation_label = await inner_option.get_attribute('data-automation-label') or ""
-                automation_id = await inner_option.get_attribute('data-automation-id') or ""
-            else:
-                text_content = await element.text_content() or ""
-                automation_label = await element.get_attribute('data-automation-label') or ""
-                automation_id = await element.get_attribute('data-automation-id') or ""
-            
-            element_info = {
-                'element_type': 'dropdown_option',
-                'index': index,
-                'type_of_input': 'dropdown_option',
-                'text': text_content.strip(),
-                'label': automation_label or text_content.strip(),
-                'data_automation_id': automation_id,
-                'data_automation_label': automation_label,
-                'selector': await self._generate_dropdown_option_selector(element),
-                'is_selected': await element.get_attribute('data-uxi-multiselectlistitem-isselected') == 'true',
-                'checked_state': await element.get_attribute('data-automation-checked') or '',
-                'multiselect_id': await element.get_attribute('data-uxi-multiselect-id') or '',
-                'item_index': await element.get_attribute('data-uxi-multiselectlistitem-index') or '',
-                'class': await element.get_attribute('class') or '',
-                'id': await element.get_attribute('id') or '',
-                'tag_name': await element.evaluate('el => el.tagName.toLowerCase()')
-            }
-            
-            return element_info
-            
-        except Exception as e:
-            self.logger.warning(f"Error getting dropdown option element info for index {index}", exception=e)
-            return None
-
-    async def _generate_dropdown_option_selector(self, element: Locator) -> str:
-        """Generate a reliable CSS selector for dropdown option elements."""
-        try:
-            # Try data-automation-id first
-            automation_id = await element.get_attribute('data-automation-id')
-            if automation_id:
-                return f'[data-automation-id="{automation_id}"]'
-            
-            # Try data-automation-label
-            automation_label = await element.get_attribute('data-automation-label')
-            if automation_label:
-                return f'[data-automation-label="{automation_label}"]'
-            
-            # Try multiselect attributes
-            multiselect_id = await element.get_attribute('data-uxi-multiselect-id')
-            item_index = await element.get_attribute('data-uxi-multiselectlistitem-index')
-            if multiselect_id and item_index:
-                return f'[data-uxi-multiselect-id="{multiselect_id}"][data-uxi-multiselectlistitem-index="{item_index}"]'
-            
-            # Try ID
-            element_id = await element.get_attribute('id')
-            if element_id:
-                return f'#{element_id}'
-            
-            # Fall back to text content selector
-            text_content = await element.text_content()
-            if text_content and text_content.strip():
-                return f'text="{text_content.strip()}"'
-            
-            return 'div[data-automation-id="promptLeafNode"]'
-            
-        except Exception as e:
-            self.logger.warning("Error generating dropdown option selector", exception=e)
-            return 'unknown'
@@ -8,21 +8,74 @@ Author: Job Automation Team
 Date: July 23, 2025
 """
 
+import asyncio
+import itertools
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from src.config import ApplicationConfig
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.config import get_config
 from src.utils.logger import ApplicationLogger
 
 
+# Maximum number of queued records written to disk in one batch
+_WRITE_BATCH_SIZE = 64
+
+# Kinds of form data log, each appended to its own <kind>_<YYYYMMDD>.jsonl file
+_LOG_KINDS = ("form_data", "step_completion", "interaction", "page_state")
+
+# Date suffix of the log files; a new file is started for each kind every day
+# so old days stop changing and can age out in clean_old_logs()
+_LOG_DATE_FORMAT = "%Y%m%d"
+
+# Interaction types whose values are never written to the logs
+_REDACT_TYPES = frozenset({"FILL"})
+
+# Process-wide record sequence number. It orders records logged within the same
+# timestamp and lets the per-kind files be merged back into one timeline.
+_record_sequence = itertools.count()
+
+# Worker threads used to unlink expired log files in parallel
+_CLEANUP_WORKERS = 8
+
+# Log file extensions: JSON Lines logs plus per-event files from older runs
+_LOG_FILE_EXTENSIONS = ('.jsonl', '.json')
+
+
+def _serialize_record(record: Dict[str, Any]) -> bytes:
+    """Serialise a log record to one newline-terminated line of UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            record,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode('utf-8')
+
+
+def _write_sync(fd: int, payload: bytes):
+    """Write a whole payload to a file descriptor, retrying short writes."""
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+
 class FormDataLogger:
     """
     Handles structured logging of form data and workflow steps.
     
     This class provides methods for logging form elements, user interactions,
-    and workflow progress to JSON files for analysis and debugging.
+    and workflow progress to JSON Lines files for analysis and debugging.
+    Records are queued and written by a background task, so logging never
+    blocks the event loop on disk I/O.
     """
     
     def __init__(self, logger: ApplicationLogger):
@@ -33,11 +86,126 @@ class FormDataLogger:
             logger: Application logger instance
         """
         self.logger = logger
-        self.config = ApplicationConfig()
+        self.config = get_config()
         self.logs_directory = self.config.paths.form_data_logs
         
         # Ensure logs directory exists
         os.makedirs(self.logs_directory, exist_ok=True)
+        
+        # One append-only JSON Lines file per log kind and day, opened on the
+        # first write of the day: kind -> (path, fd)
+        self._log_fds: Dict[str, Tuple[str, int]] = {}
+        
+        # Group commit: files written since the last fsync are synced together,
+        # at most once per FORM_LOG_FSYNC_INTERVAL
+        self._fsync_interval = self.config.FORM_LOG_FSYNC_INTERVAL / 1000
+        self._unsynced_fds = set()
+        self._last_fsync = time.monotonic()
+        
+        # Records waiting to be written, and the task that writes them; both are
+        # created on first use since there may be no running event loop yet
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Latest log file per type, with the directory mtime it was computed at
+        self._latest_cache: Dict[str, Tuple[int, Optional[str]]] = {}
+    
+    def log_file_path(self, kind: str, day: Optional[datetime] = None) -> str:
+        """
+        Get the path of the log file a kind of record is appended to.
+        
+        Args:
+            kind: Log kind (form_data, step_completion, etc.)
+            day: Day of the file, today if not given
+            
+        Returns:
+            Path of the kind's JSON Lines file for that day
+        """
+        suffix = (day or datetime.now()).strftime(_LOG_DATE_FORMAT)
+        return os.path.join(self.logs_directory, f"{kind}_{suffix}.jsonl")
+    
+    async def _enqueue(self, kind: str, record: Dict[str, Any]):
+        """
+        Queue a log record for the background writer.
+        
+        Args:
+            kind: Log kind, selecting the file the record is appended to
+            record: Log record to append
+        """
+        record["sequence"] = next(_record_sequence)
+        
+        if self._writer_task is None:
+            self._queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._drain())
+        
+        await self._queue.put((kind, record))
+    
+    async def _drain(self):
+        """Write queued records to the log files in batches."""
+        while True:
+            # Wait for one record, then take whatever else is already queued
+            batch = [await self._queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                self.logger.error(f"Failed to write {len(batch)} form data log records", exception=e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write_batch(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Append a batch of records to their log files (runs in a worker thread).
+        
+        Args:
+            batch: (kind, record) pairs to write, one JSON object per line
+        """
+        # Serialise each kind's records into one buffer so every file gets a
+        # single write() per batch
+        lines_by_kind: Dict[str, List[bytes]] = {}
+        for kind, record in batch:
+            lines_by_kind.setdefault(kind, []).append(_serialize_record(record))
+        
+        today = datetime.now()
+        for kind, lines in lines_by_kind.items():
+            path = self.log_file_path(kind, today)
+            open_path, fd = self._log_fds.get(kind, (None, None))
+            if open_path != path:
+                # First write of the kind, or the day has rolled over
+                if fd is not None:
+                    self._unsynced_fds.discard(fd)
+                    os.fsync(fd)
+                    os.close(fd)
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                self._log_fds[kind] = (path, fd)
+            
+            _write_sync(fd, b"".join(lines))
+            self._unsynced_fds.add(fd)
+        
+        if time.monotonic() - self._last_fsync >= self._fsync_interval:
+            self._sync_files()
+    
+    def _sync_files(self):
+        """Flush every log file written since the last sync to disk."""
+        for fd in self._unsynced_fds:
+            os.fsync(fd)
+        self._unsynced_fds.clear()
+        self._last_fsync = time.monotonic()
+    
+    async def close(self):
+        """Write out all queued records and close the log files."""
+        if self._writer_task is not None:
+            await self._queue.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+        
+        await asyncio.to_thread(self._sync_files)
+        for _, fd in self._log_fds.values():
+            os.close(fd)
+        self._log_fds.clear()
     
     async def log_form_elements(
         self,
@@ -46,7 +214,7 @@ class FormDataLogger:
         metadata: Optional[Dict[str, Any]] = None
     ):
         """
-        Log form elements to a JSON file.
+        Log form elements to the form data log.
         
         Args:
             form_elements: List of form element dictionaries
@@ -54,10 +222,6 @@ class FormDataLogger:
             metadata: Additional metadata to include in the log
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"form_data_{step_name}_{timestamp}.json"
-            file_path = os.path.join(self.logs_directory, filename)
-            
             log_data = {
                 "timestamp": datetime.now().isoformat(),
                 "step_name": step_name,
@@ -66,14 +230,13 @@ class FormDataLogger:
                 "form_elements": form_elements
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+            await self._enqueue("form_data", log_data)
             
             self.logger.info(
                 f"Form elements logged successfully",
                 step=step_name,
                 elements_count=len(form_elements),
-                file_path=filename
+                file_path=os.path.basename(self.log_file_path("form_data"))
             )
             
         except Exception as e:
@@ -94,10 +257,6 @@ class FormDataLogger:
             additional_data: Additional data to include in the log
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"step_completion_{step_name}_{timestamp}.json"
-            file_path = os.path.join(self.logs_directory, filename)
-            
             log_data = {
                 "timestamp": datetime.now().isoformat(),
                 "step_name": step_name,
@@ -106,15 +265,14 @@ class FormDataLogger:
                 "additional_data": additional_data or {}
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+            await self._enqueue("step_completion", log_data)
             
             status_msg = "successfully" if success else "with errors"
             self.logger.info(
                 f"Step completion logged {status_msg}",
                 step=step_name,
                 success=success,
-                file_path=filename
+                file_path=os.path.basename(self.log_file_path("step_completion"))
             )
             
         except Exception as e:
@@ -137,20 +295,15 @@ class FormDataLogger:
             success: Whether the interaction was successful
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"interaction_{interaction_type.lower()}_{timestamp}.json"
-            file_path = os.path.join(self.logs_directory, filename)
-            
             log_data = {
                 "timestamp": datetime.now().isoformat(),
                 "interaction_type": interaction_type,
                 "success": success,
                 "element_info": element_info,
-                "value": value if value and interaction_type != "FILL" else "[REDACTED]" if value else None
+                "value": "[REDACTED]" if value and interaction_type in _REDACT_TYPES else value or None
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+            await self._enqueue("interaction", log_data)
             
             self.logger.debug(
                 f"User interaction logged",
@@ -179,10 +332,6 @@ class FormDataLogger:
             additional_info: Additional state information
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"page_state_{state_name}_{timestamp}.json"
-            file_path = os.path.join(self.logs_directory, filename)
-            
             log_data = {
                 "timestamp": datetime.now().isoformat(),
                 "state_name": state_name,
@@ -191,8 +340,7 @@ class FormDataLogger:
                 "additional_info": additional_info or {}
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
+            await self._enqueue("page_state", log_data)
             
             self.logger.debug(
                 f"Page state logged",
@@ -215,21 +363,25 @@ class FormDataLogger:
             Path to the latest log file, or None if not found
         """
         try:
-            log_files = [
-                f for f in os.listdir(self.logs_directory)
-                if f.startswith(log_type) and f.endswith('.json')
-            ]
+            # The directory mtime changes whenever a log file is created or
+            # removed. Only the current day's files are appended to, and they
+            # are the newest of their kind, so appends cannot change the answer
+            # and a cached one stays valid until the directory changes
+            directory_mtime = os.stat(self.logs_directory).st_mtime_ns
+            cached_mtime, cached_path = self._latest_cache.get(log_type, (0, None))
+            if cached_mtime == directory_mtime:
+                return cached_path
             
-            if not log_files:
-                return None
+            with os.scandir(self.logs_directory) as entries:
+                log_files = [
+                    entry for entry in entries
+                    if entry.name.startswith(log_type) and entry.name.endswith(_LOG_FILE_EXTENSIONS)
+                ]
             
-            # Sort by modification time, newest first
-            log_files.sort(
-                key=lambda x: os.path.getmtime(os.path.join(self.logs_directory, x)),
-                reverse=True
-            )
+            latest_path = max(log_files, key=lambda entry: entry.stat().st_mtime).path if log_files else None
             
-            return os.path.join(self.logs_directory, log_files[0])
+            self._latest_cache[log_type] = (directory_mtime, latest_path)
+            return latest_path
             
         except Exception as e:
             self.logger.error(f"Failed to get latest log file for type: {log_type}", exception=e)
@@ -248,19 +400,29 @@ class FormDataLogger:
             
             removed_count = 0
             
-            for filename in os.listdir(self.logs_directory):
-                if not filename.endswith('.json'):
-                    continue
-                
-                file_path = os.path.join(self.logs_directory, filename)
-                file_time = os.path.getmtime(file_path)
-                
-                if file_time < cutoff_time:
-                    try:
-                        os.remove(file_path)
-                        removed_count += 1
-                    except Exception as e:
-                        self.logger.warning(f"Failed to remove old log file: {filename}", exception=e)
+            # Files the writer still holds open are never removed
+            open_paths = {path for path, _ in list(self._log_fds.values())}
+            
+            # DirEntry.stat() reuses what the directory scan already read where
+            # the platform allows, instead of one getmtime() call per file
+            with os.scandir(self.logs_directory) as entries:
+                expired = [
+                    entry for entry in entries
+                    if entry.name.endswith(_LOG_FILE_EXTENSIONS)
+                    and entry.path not in open_paths
+                    and entry.stat().st_mtime < cutoff_time
+                ]
+            
+            # Unlinks are blocking syscalls that release the GIL, so issue them in parallel
+            with ThreadPoolExecutor(max_workers=_CLEANUP_WORKERS) as executor:
+                removals = [(entry, executor.submit(os.unlink, entry.path)) for entry in expired]
+            
+            for entry, removal in removals:
+                try:
+                    removal.result()
+                    removed_count += 1
+                except Exception as e:
+                    self.logger.warning(f"Failed to remove old log file: {entry.name}", exception=e)
             
             if removed_count > 0:
                 self.logger.info(f"Cleaned up {removed_count} old log files")
@@ -8,11 +8,25 @@ Author: Job Automation Team
 Date: July 23, 2025
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
-from src.config import ApplicationConfig
+from src.config import get_config
+
+
+# Message templates for the specialised log methods. Arguments are passed to the
+# logging framework, which only substitutes them once a handler takes the record.
+_SUCCESS_TEMPLATE = "✅ SUCCESS: %s"
+_FAILURE_TEMPLATE = "❌ FAILURE: %s"
+_WORKFLOW_TEMPLATE = "🔄 WORKFLOW: %s - %s"
+_FORM_TEMPLATE = "📝 FORM: %s - %s"
+_NAVIGATION_TEMPLATE = "🌐 NAVIGATION: %s - %s"
+_PERFORMANCE_TEMPLATE = "📊 PERFORMANCE: %s = %s%s"
+_CONTEXT_SUFFIX = " | Context: %s"
 
 
 class ApplicationLogger:
@@ -30,8 +44,9 @@ class ApplicationLogger:
         Args:
             logger_name: Name identifier for this logger instance
         """
-        self.config = ApplicationConfig()
+        self.config = get_config()
         self.logger_name = logger_name
+        self.file_log_listener: Optional[QueueListener] = None
         self.logger = self._setup_logger()
     
     def _setup_logger(self) -> logging.Logger:
@@ -66,13 +81,20 @@ class ApplicationLogger:
         console_handler.setFormatter(console_formatter)
         logger.addHandler(console_handler)
         
-        # File handler for detailed logging
+        # File handler for detailed logging, run by a background listener thread
+        # so log calls only enqueue the record instead of writing to disk
         if self.config.ENABLE_DETAILED_LOGGING:
             log_file_path = self._get_log_file_path()
             file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            
+            log_queue = queue.Queue(-1)
+            self.file_log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            self.file_log_listener.start()
+            atexit.register(self.file_log_listener.stop)
+            
+            logger.addHandler(QueueHandler(log_queue))
         
         return logger
     
@@ -87,6 +109,23 @@ class ApplicationLogger:
         log_filename = f"job_automation_{timestamp}.log"
         return os.path.join(self.config.paths.logs_directory, log_filename)
     
+    def _log_template(self, level: int, template: str, args: tuple, context: dict):
+        """
+        Log a message template with lazily substituted arguments.
+        
+        Args:
+            level: Logging level of the record
+            template: %-style message template
+            args: Arguments for the template
+            context: Additional context data, appended when present
+        """
+        if context:
+            template += _CONTEXT_SUFFIX
+            args += (context,)
+        
+        # stacklevel=2 keeps funcName pointing at the public method (e.g. workflow_step)
+        self.logger.log(level, template, *args, stacklevel=2)
+    
     def debug(self, message: str, **kwargs):
         """
         Log a debug message.
@@ -95,6 +134,9 @@ class ApplicationLogger:
             message: Debug message to log
             **kwargs: Additional context data
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         if kwargs:
             message = f"{message} | Context: {kwargs}"
         self.logger.debug(message)
@@ -107,6 +149,9 @@ class ApplicationLogger:
             message: Information message to log
             **kwargs: Additional context data
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         if kwargs:
             message = f"{message} | Context: {kwargs}"
         self.logger.info(message)
@@ -119,6 +164,9 @@ class ApplicationLogger:
             message: Warning message to log
             **kwargs: Additional context data
         """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        
         if kwargs:
             message = f"{message} | Context: {kwargs}"
         self.logger.warning(message)
@@ -132,6 +180,9 @@ class ApplicationLogger:
             exception: Optional exception object for additional context
             **kwargs: Additional context data
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         if exception:
             message = f"{message} | Exception: {str(exception)}"
         if kwargs:
@@ -146,10 +197,10 @@ class ApplicationLogger:
             message: Success message to log
             **kwargs: Additional context data
         """
-        success_message = f"✅ SUCCESS: {message}"
-        if kwargs:
-            success_message = f"{success_message} | Context: {kwargs}"
-        self.logger.info(success_message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._log_template(logging.INFO, _SUCCESS_TEMPLATE, (message,), kwargs)
     
     def failure(self, message: str, **kwargs):
         """
@@ -159,10 +210,10 @@ class ApplicationLogger:
             message: Failure message to log
             **kwargs: Additional context data
         """
-        failure_message = f"❌ FAILURE: {message}"
-        if kwargs:
-            failure_message = f"{failure_message} | Context: {kwargs}"
-        self.logger.error(failure_message)
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
+        self._log_template(logging.ERROR, _FAILURE_TEMPLATE, (message,), kwargs)
     
     def workflow_step(self, step_name: str, status: str = "STARTED", **kwargs):
         """
@@ -173,14 +224,11 @@ class ApplicationLogger:
             status: Status of the step (STARTED, COMPLETED, FAILED)
             **kwargs: Additional context data
         """
-        workflow_message = f"🔄 WORKFLOW: {step_name} - {status}"
-        if kwargs:
-            workflow_message = f"{workflow_message} | Context: {kwargs}"
+        level = logging.ERROR if status.upper() == "FAILED" else logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
         
-        if status.upper() == "FAILED":
-            self.logger.error(workflow_message)
-        else:
-            self.logger.info(workflow_message)
+        self._log_template(level, _WORKFLOW_TEMPLATE, (step_name, status), kwargs)
     
     def form_interaction(self, action: str, element_info: str, **kwargs):
         """
@@ -191,10 +239,10 @@ class ApplicationLogger:
             element_info: Information about the form element
             **kwargs: Additional context data
         """
-        form_message = f"📝 FORM: {action} - {element_info}"
-        if kwargs:
-            form_message = f"{form_message} | Context: {kwargs}"
-        self.logger.info(form_message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._log_template(logging.INFO, _FORM_TEMPLATE, (action, element_info), kwargs)
     
     def page_navigation(self, url: str, action: str = "NAVIGATED", **kwargs):
         """
@@ -205,10 +253,10 @@ class ApplicationLogger:
             action: Type of navigation action
             **kwargs: Additional context data
         """
-        nav_message = f"🌐 NAVIGATION: {action} - {url}"
-        if kwargs:
-            nav_message = f"{nav_message} | Context: {kwargs}"
-        self.logger.info(nav_message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._log_template(logging.INFO, _NAVIGATION_TEMPLATE, (action, url), kwargs)
     
     def performance_metric(self, metric_name: str, value: float, unit: str = "ms", **kwargs):
         """
@@ -220,7 +268,7 @@ class ApplicationLogger:
             unit: Unit of measurement
             **kwargs: Additional context data
         """
-        perf_message = f"📊 PERFORMANCE: {metric_name} = {value}{unit}"
-        if kwargs:
-            perf_message = f"{perf_message} | Context: {kwargs}"
-        self.logger.info(perf_message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self._log_template(logging.INFO, _PERFORMANCE_TEMPLATE, (metric_name, value, unit), kwargs)
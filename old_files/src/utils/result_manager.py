@@ -8,17 +8,64 @@ Author: Job Automation Team
 Date: July 23, 2025
 """
 
+import asyncio
 import json
 import os
+import re
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
+from urllib.parse import urlsplit
 from playwright.async_api import Page
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.config import ApplicationConfig
 from src.utils.logger import ApplicationLogger
 from src.utils.form_extractor import FormExtractor
 
 
+# Purpose categories in priority order, each with one precompiled keyword
+# pattern; the first category whose pattern occurs in an element's label or
+# name wins, as with the original sequence of keyword checks
+_PURPOSE_PATTERNS = [
+    ("personal_info", re.compile(r'name|first|last|middle', re.I)),
+    ("contact_info", re.compile(r'email|phone|contact', re.I)),
+    ("address_info", re.compile(r'address|street|city|state|zip|country', re.I)),
+    ("professional_info", re.compile(r'job|position|title|company|experience', re.I)),
+    ("authentication", re.compile(r'password|login|username', re.I)),
+]
+
+# All purpose categories, in the order they are reported
+_PURPOSE_CATEGORIES = [category for category, _ in _PURPOSE_PATTERNS] + ["actions", "other"]
+
+# Element types that accept input, and input types within them that do not
+_FILLABLE_ELEMENT_TYPES = frozenset({'input', 'textarea', 'select'})
+_NON_FILLABLE_INPUT_TYPES = frozenset({'submit', 'button', 'reset'})
+
+# (steps completed, success rate, overall status) for each
+# (auth_success, form_success) outcome of the two workflow steps
+_STATUS_TABLE = {
+    (True, True): (2, 100.0, "FULLY_SUCCESSFUL"),
+    (True, False): (1, 50.0, "PARTIALLY_SUCCESSFUL"),
+    (False, True): (1, 50.0, "FAILED"),
+    (False, False): (0, 0.0, "FAILED"),
+}
+
+
+class ElementAnalysis(NamedTuple):
+    """Aggregate counts over the extracted form elements."""
+    total: int
+    by_type: Dict[str, int]
+    by_purpose: Dict[str, int]
+    required: int
+    fillable: int
+
+
 class ResultManager:
     """
     Manages workflow results including generation, saving, and display.
@@ -62,12 +109,21 @@ class ResultManager:
             current_url = page.url
             page_title = await page.title()
             
+            # Aggregate the elements in a single pass
+            analysis = self._analyze_elements(final_form_elements)
+            
+            # Look up step count, success rate and status for this outcome
+            steps_completed, success_rate, status = _STATUS_TABLE[(bool(auth_success), bool(form_success))]
+            
+            # Read the clock once so all execution timestamps agree
+            now = datetime.now()
+            
             # Create comprehensive results
             results = {
                 "workflow_execution": {
-                    "timestamp": datetime.now().isoformat(),
-                    "execution_date": datetime.now().strftime("%Y-%m-%d"),
-                    "execution_time": datetime.now().strftime("%H:%M:%S"),
+                    "timestamp": now.isoformat(),
+                    "execution_date": now.strftime("%Y-%m-%d"),
+                    "execution_time": now.strftime("%H:%M:%S"),
                     "workflow_completed": auth_success and form_success,
                     "total_duration_seconds": self._calculate_execution_duration()
                 },
@@ -78,8 +134,8 @@ class ResultManager:
                 },
                 "form_processing": {
                     "success": form_success,
-                    "total_elements_found": len(final_form_elements),
-                    "elements_by_type": self._categorize_elements_by_type(final_form_elements)
+                    "total_elements_found": analysis.total,
+                    "elements_by_type": analysis.by_type
                 },
                 "page_information": {
                     "final_url": current_url,
@@ -87,22 +143,21 @@ class ResultManager:
                     "domain": self._extract_domain(current_url)
                 },
                 "form_elements_analysis": {
-                    "total_elements": len(final_form_elements),
-                    "required_elements": self._count_required_elements(final_form_elements),
-                    "fillable_elements": self._count_fillable_elements(final_form_elements),
-                    "elements_by_category": self._categorize_elements_by_purpose(final_form_elements)
+                    "required_elements": analysis.required,
+                    "fillable_elements": analysis.fillable,
+                    "elements_by_category": analysis.by_purpose
                 },
                 "detailed_form_elements": final_form_elements,
                 "execution_summary": {
-                    "steps_completed": self._get_completed_steps(auth_success, form_success),
-                    "success_rate": self._calculate_success_rate(auth_success, form_success),
-                    "status": self._determine_overall_status(auth_success, form_success)
+                    "steps_completed": steps_completed,
+                    "success_rate": success_rate,
+                    "status": status
                 }
             }
             
             self.logger.success(
                 "Workflow results generated successfully",
-                total_elements=len(final_form_elements),
+                total_elements=analysis.total,
                 auth_success=auth_success,
                 form_success=form_success
             )
@@ -117,19 +172,33 @@ class ResultManager:
         """
         Save workflow results to a JSON file.
         
+        The detailed form elements, if present, are written separately as
+        NDJSON (one element per line) next to the summary file, so the full
+        element list is never serialised as part of one large document.
+        
         Args:
             results: Results dictionary to save
             
         Returns:
-            Path to saved file if successful, None otherwise
+            Path to saved summary file if successful, None otherwise
         """
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"workflow_results_{timestamp}.json"
             file_path = os.path.join(self.config.paths.logs_directory, filename)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            # Split the element list out of the summary without mutating the caller's dict
+            summary = {key: value for key, value in results.items() if key != "detailed_form_elements"}
+            form_elements = results.get("detailed_form_elements") or []
+            
+            # Serialise and write on a worker thread so the event loop keeps running
+            await asyncio.to_thread(self._write_results_file, file_path, summary)
+            
+            if form_elements:
+                elements_filename = f"workflow_elements_{timestamp}.ndjson"
+                elements_path = os.path.join(self.config.paths.logs_directory, elements_filename)
+                await asyncio.to_thread(self._write_elements_file, elements_path, form_elements)
+                self.logger.success(f"Form elements saved to: {elements_filename}")
             
             self.logger.success(f"Workflow results saved to: {filename}")
             return file_path
@@ -138,6 +207,28 @@ class ResultManager:
             self.logger.error("Failed to save workflow results", exception=e)
             return None
     
+    def _write_results_file(self, file_path: str, results: Dict[str, Any]):
+        """Write results to a JSON file (blocking; run off the event loop)."""
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+    
+    def _write_elements_file(self, file_path: str, form_elements: List[Dict[str, Any]]):
+        """Stream form elements to an NDJSON file, one element per line (blocking)."""
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                for element in form_elements:
+                    f.write(orjson.dumps(element, option=orjson.OPT_NON_STR_KEYS))
+                    f.write(b'\n')
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                for element in form_elements:
+                    f.write(json.dumps(element, ensure_ascii=False))
+                    f.write('\n')
+    
     def display_workflow_summary(self, results: Dict[str, Any]):
         """
         Display a formatted summary of workflow results.
@@ -146,125 +237,121 @@ class ResultManager:
             results: Results dictionary to display
         """
         try:
-            print("\n" + "=" * 80)
-            print("🤖 JOB APPLICATION AUTOMATION - WORKFLOW SUMMARY")
-            print("=" * 80)
+            # Collect every line and write the summary to stdout in one call
+            lines = [
+                "\n" + "=" * 80,
+                "🤖 JOB APPLICATION AUTOMATION - WORKFLOW SUMMARY",
+                "=" * 80,
+            ]
             
             # Execution summary
             execution = results.get("workflow_execution", {})
-            print(f"📅 Execution Date: {execution.get('execution_date', 'Unknown')}")
-            print(f"⏰ Execution Time: {execution.get('execution_time', 'Unknown')}")
-            print(f"✅ Workflow Completed: {execution.get('workflow_completed', False)}")
+            lines.append(f"📅 Execution Date: {execution.get('execution_date', 'Unknown')}")
+            lines.append(f"⏰ Execution Time: {execution.get('execution_time', 'Unknown')}")
+            lines.append(f"✅ Workflow Completed: {execution.get('workflow_completed', False)}")
             
             # Authentication summary
             auth = results.get("authentication", {})
-            print(f"\n🔐 Authentication:")
-            print(f"   Method: {auth.get('method_display_name', 'Unknown')}")
-            print(f"   Success: {'✅ Yes' if auth.get('success') else '❌ No'}")
+            lines.append(f"\n🔐 Authentication:")
+            lines.append(f"   Method: {auth.get('method_display_name', 'Unknown')}")
+            lines.append(f"   Success: {'✅ Yes' if auth.get('success') else '❌ No'}")
             
             # Form processing summary
             form = results.get("form_processing", {})
-            print(f"\n📝 Form Processing:")
-            print(f"   Success: {'✅ Yes' if form.get('success') else '❌ No'}")
-            print(f"   Elements Found: {form.get('total_elements_found', 0)}")
+            lines.append(f"\n📝 Form Processing:")
+            lines.append(f"   Success: {'✅ Yes' if form.get('success') else '❌ No'}")
+            lines.append(f"   Elements Found: {form.get('total_elements_found', 0)}")
             
             # Page information
             page_info = results.get("page_information", {})
-            print(f"\n🌐 Final Page:")
-            print(f"   URL: {page_info.get('final_url', 'Unknown')}")
-            print(f"   Title: {page_info.get('page_title', 'Unknown')}")
+            lines.append(f"\n🌐 Final Page:")
+            lines.append(f"   URL: {page_info.get('final_url', 'Unknown')}")
+            lines.append(f"   Title: {page_info.get('page_title', 'Unknown')}")
             
             # Form elements analysis
             analysis = results.get("form_elements_analysis", {})
-            print(f"\n📊 Form Elements Analysis:")
-            print(f"   Total Elements: {analysis.get('total_elements', 0)}")
-            print(f"   Required Elements: {analysis.get('required_elements', 0)}")
-            print(f"   Fillable Elements: {analysis.get('fillable_elements', 0)}")
+            lines.append(f"\n📊 Form Elements Analysis:")
+            total_elements = analysis.get('total_elements', form.get('total_elements_found', 0))
+            lines.append(f"   Total Elements: {total_elements}")
+            lines.append(f"   Required Elements: {analysis.get('required_elements', 0)}")
+            lines.append(f"   Fillable Elements: {analysis.get('fillable_elements', 0)}")
             
             # Elements by type
             elements_by_type = form.get("elements_by_type", {})
             if elements_by_type:
-                print(f"\n📋 Elements by Type:")
-                for element_type, count in elements_by_type.items():
-                    print(f"   {element_type.title()}: {count}")
+                lines.append(f"\n📋 Elements by Type:")
+                lines.extend(f"   {element_type.title()}: {count}" for element_type, count in elements_by_type.items())
             
             # Execution summary
             summary = results.get("execution_summary", {})
-            print(f"\n📈 Execution Summary:")
-            print(f"   Steps Completed: {summary.get('steps_completed', 0)}/2")
-            print(f"   Success Rate: {summary.get('success_rate', 0)}%")
-            print(f"   Overall Status: {summary.get('status', 'Unknown')}")
+            lines.append(f"\n📈 Execution Summary:")
+            lines.append(f"   Steps Completed: {summary.get('steps_completed', 0)}/2")
+            lines.append(f"   Success Rate: {summary.get('success_rate', 0)}%")
+            lines.append(f"   Overall Status: {summary.get('status', 'Unknown')}")
+            
+            lines.append("=" * 80)
             
-            print("=" * 80)
+            sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
             self.logger.error("Failed to display workflow summary", exception=e)
             print(f"\n❌ Error displaying summary: {str(e)}")
     
-    def _categorize_elements_by_type(self, elements: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Categorize form elements by their type."""
-        categories = {}
+    def _analyze_elements(self, elements: List[Dict[str, Any]]) -> ElementAnalysis:
+        """
+        Aggregate form elements by type and purpose in a single pass.
+        
+        Args:
+            elements: Extracted form elements
+            
+        Returns:
+            ElementAnalysis with the total, per-type and per-purpose counts,
+            and the number of required and fillable elements
+        """
+        type_counts = Counter()
+        purpose_counts = Counter()
+        required = 0
+        fillable = 0
         
         for element in elements:
             element_type = element.get('element_type', 'unknown')
-            categories[element_type] = categories.get(element_type, 0) + 1
+            input_type = element.get('type_of_input', '')
+            type_counts[element_type] += 1
+            purpose_counts[self._element_purpose(element, element_type, input_type)] += 1
+            
+            if element.get('required', False):
+                required += 1
+            if element_type in _FILLABLE_ELEMENT_TYPES and input_type not in _NON_FILLABLE_INPUT_TYPES:
+                fillable += 1
         
-        return categories
+        return ElementAnalysis(
+            total=len(elements),
+            by_type=dict(type_counts),
+            by_purpose={category: purpose_counts[category] for category in _PURPOSE_CATEGORIES},
+            required=required,
+            fillable=fillable
+        )
     
-    def _categorize_elements_by_purpose(self, elements: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Categorize form elements by their likely purpose."""
-        categories = {
-            "personal_info": 0,
-            "contact_info": 0,
-            "address_info": 0,
-            "professional_info": 0,
-            "authentication": 0,
-            "actions": 0,
-            "other": 0
-        }
+    def _element_purpose(self, element: Dict[str, Any], element_type: str, input_type: str) -> str:
+        """Determine the likely purpose category of a form element."""
+        field_text = f"{element.get('label', '')} {element.get('name', '')}"
         
-        for element in elements:
-            label = element.get('label', '').lower()
-            name = element.get('name', '').lower()
-            input_type = element.get('type_of_input', '').lower()
-            
-            field_text = f"{label} {name}".lower()
-            
-            if any(keyword in field_text for keyword in ['name', 'first', 'last', 'middle']):
-                categories["personal_info"] += 1
-            elif any(keyword in field_text for keyword in ['email', 'phone', 'contact']):
-                categories["contact_info"] += 1
-            elif any(keyword in field_text for keyword in ['address', 'street', 'city', 'state', 'zip', 'country']):
-                categories["address_info"] += 1
-            elif any(keyword in field_text for keyword in ['job', 'position', 'title', 'company', 'experience']):
-                categories["professional_info"] += 1
-            elif any(keyword in field_text for keyword in ['password', 'login', 'username']):
-                categories["authentication"] += 1
-            elif input_type in ['submit', 'button'] or element.get('element_type') == 'button':
-                categories["actions"] += 1
-            else:
-                categories["other"] += 1
+        for category, pattern in _PURPOSE_PATTERNS:
+            if pattern.search(field_text):
+                return category
         
-        return categories
-    
-    def _count_required_elements(self, elements: List[Dict[str, Any]]) -> int:
-        """Count required form elements."""
-        return sum(1 for element in elements if element.get('required', False))
-    
-    def _count_fillable_elements(self, elements: List[Dict[str, Any]]) -> int:
-        """Count fillable form elements."""
-        fillable_types = ['input', 'textarea', 'select']
-        return sum(1 for element in elements 
-                  if element.get('element_type') in fillable_types 
-                  and element.get('type_of_input') not in ['submit', 'button', 'reset'])
+        if input_type.lower() in ['submit', 'button'] or element_type == 'button':
+            return "actions"
+        return "other"
     
     def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL."""
+        """Extract domain (network location) from URL."""
+        if not isinstance(url, str):
+            return "unknown"
         try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            return parsed.netloc
-        except:
+            # urlsplit gives the same netloc as urlparse without the params split
+            return urlsplit(url).netloc
+        except ValueError:
             return "unknown"
     
     def _calculate_execution_duration(self) -> float:
@@ -273,30 +360,6 @@ class ResultManager:
         # you'd track start time and calculate actual duration
         return 0.0
     
-    def _get_completed_steps(self, auth_success: bool, form_success: bool) -> int:
-        """Count completed workflow steps."""
-        completed = 0
-        if auth_success:
-            completed += 1
-        if form_success:
-            completed += 1
-        return completed
-    
-    def _calculate_success_rate(self, auth_success: bool, form_success: bool) -> float:
-        """Calculate overall success rate."""
-        total_steps = 2
-        completed_steps = self._get_completed_steps(auth_success, form_success)
-        return round((completed_steps / total_steps) * 100, 1)
-    
-    def _determine_overall_status(self, auth_success: bool, form_success: bool) -> str:
-        """Determine overall workflow status."""
-        if auth_success and form_success:
-            return "FULLY_SUCCESSFUL"
-        elif auth_success:
-            return "PARTIALLY_SUCCESSFUL"
-        else:
-            return "FAILED"
-    
     async def _create_error_results(self, page: Page, auth_type: str, error_message: str) -> Dict[str, Any]:
         """Create error results when result generation fails."""
         try:
@@ -340,11 +403,12 @@ class ResultManager:
     
     def create_sample_results(self) -> Dict[str, Any]:
         """Create sample results for testing purposes."""
+        now = datetime.now()
         return {
             "workflow_execution": {
-                "timestamp": datetime.now().isoformat(),
-                "execution_date": datetime.now().strftime("%Y-%m-%d"),
-                "execution_time": datetime.now().strftime("%H:%M:%S"),
+                "timestamp": now.isoformat(),
+                "execution_date": now.strftime("%Y-%m-%d"),
+                "execution_time": now.strftime("%H:%M:%S"),
                 "workflow_completed": True,
                 "total_duration_seconds": 45.2
             },
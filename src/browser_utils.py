@@ -1,12 +1,19 @@
 import asyncio
-from playwright.async_api import async_playwright, Browser, Page
+import os
+from playwright.async_api import async_playwright, Browser, Locator, Page
 from typing import Tuple
+from src.constants import NEXT_BUTTON
 
-async def launch_browser(url: str) -> tuple[Browser, Page]:
+# Per-action delay in ms; set JOBAUTO_SLOW_MO (e.g. 1000) to watch a run while debugging
+SLOW_MO = int(os.environ.get('JOBAUTO_SLOW_MO', '0'))
+# Load state to wait for on the initial navigation ('networkidle' is much slower on Workday)
+WAIT_UNTIL = os.environ.get('JOBAUTO_WAIT_UNTIL', 'domcontentloaded')
+
+async def launch_browser(url: str, wait_until: str = WAIT_UNTIL) -> tuple[Browser, Page]:
     playwright_instance = await async_playwright().start()
     browser = await playwright_instance.chromium.launch(
         headless=False,
-        slow_mo=1000,
+        slow_mo=SLOW_MO,
         args=['--disable-web-security', '--disable-features=VizDisplayCompositor']
     )
     context = await browser.new_context(
@@ -14,7 +21,51 @@ async def launch_browser(url: str) -> tuple[Browser, Page]:
         user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     )
     page = await context.new_page()
-    await page.goto(url, wait_until='networkidle', timeout=30000)
-    await page.wait_for_timeout(3000)
+    await page.goto(url, wait_until=wait_until, timeout=30000)
     print("Browser opened and navigated to the URL.")
     return browser, page
+
+_FILL_FIELDS_JS = """(fields) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    return fields.map(([selector, value, onlyIfEmpty]) => {
+        const el = document.querySelector(selector);
+        if (!el) return false;
+        if (onlyIfEmpty && el.value) return true;
+        // Native setter so React-controlled inputs pick up the new value
+        setValue.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    });
+}"""
+
+async def fill_fields(page: Page, fields: list[tuple[str, str]], only_if_empty: bool = False) -> list[bool]:
+    if not fields:
+        return []
+    return await page.evaluate(_FILL_FIELDS_JS, [(selector, value, only_if_empty) for selector, value in fields])
+
+async def click_next(page: Page, page_marker: Locator, timeout: int = 15000):
+    # Workday swaps pages in place without a new load, so wait for an element of the current page to go away
+    await page.locator(NEXT_BUTTON).click()
+    await page_marker.first.wait_for(state='detached', timeout=timeout)
+
+async def ensure_checked(element) -> bool:
+    # Check a checkbox/radio (Locator or ElementHandle) in one round-trip; a no-op if already checked
+    return await element.evaluate('el => el.checked || (el.click(), el.checked)')
+
+_FIND_OPTION_JS = """([selector, needle]) => {
+    const options = document.querySelectorAll(selector);
+    for (let index = 0; index < options.length; index++) {
+        if ((options[index].textContent || '').toLowerCase().includes(needle)) return index;
+    }
+    return -1;
+}"""
+
+async def click_option(page: Page, option_selector: str, text: str, timeout: int = 5000) -> bool:
+    # Wait for the list to render, find the first option containing text in one round-trip, then click it
+    await page.wait_for_selector(option_selector, timeout=timeout)
+    index = await page.evaluate(_FIND_OPTION_JS, [option_selector, text.lower()])
+    if index < 0:
+        return False
+    await page.locator(option_selector).nth(index).click()
+    return True
@@ -0,0 +1,13 @@
+MONTH_MAP = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
+    'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
+    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+
+# Selectors shared by several application pages
+NEXT_BUTTON = 'button[data-automation-id="pageFooterNextButton"]'
+OPENED_OPTION = 'div[visibility="opened"] li[role="option"]'
+PROMPT_LEAF = '[data-automation-id="promptLeafNode"]'
+SEARCH_INPUT = 'input[placeholder="Search"]'
+LISTBOX_BUTTON = 'button[aria-haspopup="listbox"]'
+MULTISELECT_INPUT = '[data-automation-id="multiselectInputContainer"]'
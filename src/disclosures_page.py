@@ -1,23 +1,26 @@
 from playwright.async_api import Page
-import json
+from src.browser_utils import click_next
+from src.constants import LISTBOX_BUTTON, OPENED_OPTION
+from src.json_utils import write_json_async
 
 async def fill_disclosures_page(page: Page, user_data: dict, log_path: str):
     log = {'questions': []}
     label_text = "Are you legally authorized to work in the United States?"
-    legend = await page.query_selector(f'legend:has-text("{label_text}")')
-    if not legend:
-        legend = await page.query_selector(f'label:has-text("{label_text}")')
-    if legend:
-        fieldset = await legend.evaluate_handle('node => node.closest("fieldset")')
-        button = await fieldset.query_selector('button[aria-haspopup="listbox"]')
-        if button:
-            await button.click()
-            yes_option = await page.query_selector('div[visibility="opened"] li[role="option"] >> text=Yes')
-            if yes_option:
-                await yes_option.click()
-                log['questions'].append({'question': label_text, 'answer': 'Yes'})
-    save_and_continue = page.locator('button[data-automation-id="pageFooterNextButton"]')
-    await save_and_continue.click()
-    await page.wait_for_timeout(5000)
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+    question = page.locator(f'fieldset:has(legend:has-text("{label_text}")), fieldset:has(label:has-text("{label_text}"))')
+    button = question.locator(LISTBOX_BUTTON).first
+    # Wait for the page to render before checking for the question
+    try:
+        await button.wait_for(timeout=15000)
+    except Exception:
+        pass
+    if await button.count():
+        await button.click()
+        yes_option = page.locator(f'{OPENED_OPTION} >> text=Yes').first
+        try:
+            await yes_option.wait_for(timeout=5000)
+            await yes_option.click()
+            log['questions'].append({'question': label_text, 'answer': 'Yes'})
+        except Exception:
+            pass
+    await write_json_async(log_path, log)
+    await click_next(page, question)
@@ -1,12 +1,17 @@
+import re
 from playwright.async_api import Page
-import json
+from src.browser_utils import click_option, fill_fields
+from src.constants import MONTH_MAP, MULTISELECT_INPUT
+from src.json_utils import write_json_async
+
+# "Mon YYYY" graduation dates; anything else is treated as a bare year
+_MONTH_YEAR_RE = re.compile(r'([a-z]{3})[a-z]*\.?\s+(\d{4})', re.I)
 
 async def fill_education_page(page: Page, user_data: dict, log_path: str):
     log = {'education': []}
     education_entries = user_data.get('education', [])
     if not education_entries:
-        with open(log_path, 'w') as f:
-            json.dump(log, f, indent=2)
+        await write_json_async(log_path, log)
         return
     education_section = page.locator('div[role="group"][aria-labelledby="Education-section"]')
     education_section_add_button = education_section.locator('button[data-automation-id="add-button"]')
@@ -16,80 +21,65 @@ async def fill_education_page(page: Page, user_data: dict, log_path: str):
         await page.wait_for_selector(panel_prefix, timeout=20000)
         # School Name
         school_selector = f'{panel_prefix} input[name="schoolName"]'
+        # The panel container renders before its inputs; fill_fields doesn't wait, so wait here
+        await page.locator(school_selector).wait_for(timeout=20000)
+        fields = []
         if ed_entry.get('institution'):
-            await page.fill(school_selector, ed_entry['institution'])
+            fields.append((school_selector, ed_entry['institution']))
         # Degree dropdown
         degree_button = f'{panel_prefix} button[name="degree"]'
         degree = ed_entry.get('degree', '').lower()
         if degree:
             try:
                 await page.click(degree_button)
-                await page.wait_for_timeout(1000)
-                degree_options = await page.query_selector_all('li[role="option"]')
-                for option in degree_options:
-                    option_text = await option.text_content()
-                    if option_text and degree in option_text.lower():
-                        await option.click()
-                        break
+                await click_option(page, 'li[role="option"]', degree)
             except Exception:
                 pass
         # Field of Study
-        field_of_study_selector = f'{panel_prefix} [data-automation-id="multiselectInputContainer"]'
+        field_of_study_selector = f'{panel_prefix} {MULTISELECT_INPUT}'
         field_of_study = ed_entry.get('field_of_study') or ed_entry.get('major') or ed_entry.get('subject')
         if field_of_study:
             try:
                 await page.click(field_of_study_selector)
-                await page.wait_for_timeout(1000)
-                field_of_study_options = await page.query_selector_all('div[data-automation-id="promptOption"]')
-                for option in field_of_study_options:
-                    option_text = await option.text_content()
-                    if option_text and field_of_study.lower() in option_text.lower():
-                        await option.click()
-                        break
+                await click_option(page, 'div[data-automation-id="promptOption"]', field_of_study)
             except Exception:
                 pass
         # Graduation date
         graduation_date = ed_entry.get('graduation_date') or ed_entry.get('end_date') or ed_entry.get('graduation_year')
         if graduation_date:
             try:
-                month_map = {
-                    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-                    'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-                    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-                }
-                if isinstance(graduation_date, int):
-                    year = str(graduation_date)
-                    month_num = '05'
-                elif ' ' in str(graduation_date):
-                    month_name, year = str(graduation_date).split(maxsplit=1)
-                    month_num = month_map.get(month_name[:3], '05')
+                match = _MONTH_YEAR_RE.match(str(graduation_date))
+                if match:
+                    month_name, year = match.groups()
+                    month_num = MONTH_MAP.get(month_name.title(), '05')
                 else:
                     year = str(graduation_date)
                     month_num = '05'
                 grad_month_selector = f'{panel_prefix} div[data-automation-id="formField-graduationDate"] input[data-automation-id="dateSectionMonth-input"]'
                 grad_year_selector = f'{panel_prefix} div[data-automation-id="formField-graduationDate"] input[data-automation-id="dateSectionYear-input"]'
-                await page.fill(grad_month_selector, month_num)
-                await page.fill(grad_year_selector, year)
+                fields.append((grad_month_selector, month_num))
+                fields.append((grad_year_selector, year))
             except Exception:
                 pass
+        # Fill every collected field in one round-trip
+        found = await fill_fields(page, fields)
+        missing_fields = [selector for (selector, _), present in zip(fields, found) if not present]
+        if missing_fields:
+            print(f"  Could not find fields to fill in education panel {panel_number}: {missing_fields}")
         log['education'].append({
             'panel': panel_number,
             'school': ed_entry.get('institution'),
             'degree': ed_entry.get('degree'),
             'field_of_study': field_of_study,
-            'graduation_date': graduation_date
+            'graduation_date': graduation_date,
+            'missing_fields': missing_fields
         })
     for i, ed_entry in enumerate(education_entries):
         panel_number = i + 1
         if i == 0:
             await fill_education_form(ed_entry, panel_number)
         else:
-            education_section = page.locator('div[role="group"][aria-labelledby="Education-section"]')
-            add_button = education_section.locator('button[data-automation-id="add-button"]')
-            await add_button.wait_for(timeout=20000)
-            await add_button.click()
-            await page.wait_for_timeout(3000)
+            await education_section_add_button.wait_for(timeout=20000)
+            await education_section_add_button.click()
             await fill_education_form(ed_entry, panel_number)
-        await page.wait_for_timeout(2000)
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+    await write_json_async(log_path, log)
@@ -1,113 +1,150 @@
 from playwright.async_api import Page
-import json
 import re
+import string
+from src.browser_utils import click_next, click_option, ensure_checked, fill_fields
+from src.constants import LISTBOX_BUTTON, MULTISELECT_INPUT, OPENED_OPTION, PROMPT_LEAF, SEARCH_INPUT
+from src.json_utils import write_json_async
+
+_MY_INFO_PAGE = 'div[data-automation-id="applyFlowMyInfoPage"]'
+_TEXT_INPUTS = f'{_MY_INFO_PAGE} input[type="text"]'
+
+# Id and label text for each input: its label[for=id], else the label wrapping it
+_INPUT_LABELS_JS = """(inputs) => inputs.map(el => {
+    const forLabel = el.id ? document.querySelector(`label[for="${CSS.escape(el.id)}"]`) : null;
+    let label = forLabel ? forLabel.textContent : '';
+    if (!label) {
+        const parentLabel = el.closest('label');
+        label = parentLabel ? parentLabel.textContent : '';
+    }
+    return {id: el.id, label};
+})"""
+
+def get_nested(data, keys):
+    for k in keys:
+        if isinstance(data, dict):
+            data = data.get(k)
+        else:
+            return ""
+    return data if data is not None else ""
+
+LABEL_MAP = {
+    "given name": ("personal_information", "first_name"),
+    "first name": ("personal_information", "first_name"),
+    "family name": ("personal_information", "last_name"),
+    "last name": ("personal_information", "last_name"),
+    "address line 1": ("personal_information", "address", "street"),
+    "city": ("personal_information", "address", "city"),
+    "town": ("personal_information", "address", "city"),
+    "postal code": ("personal_information", "address", "zipcode"),
+    "zip": ("personal_information", "address", "zipcode"),
+    "phone number": ("personal_information", "phone"),
+    "extension": ("personal_information", "extension"),
+    "country": ("personal_information", "address", "country"),
+    "state": ("personal_information", "address", "state")
+}
+
+def info_values(user_data: dict) -> dict:
+    # Several labels share a path (e.g. city/town), so resolve each distinct path once
+    resolved = {path: get_nested(user_data, path) for path in set(LABEL_MAP.values())}
+    return {label: resolved[path] for label, path in LABEL_MAP.items()}
+
+# One pattern finding every label key in a label; the lookahead also reports keys
+# that overlap another match. Among the keys found, LABEL_MAP order decides.
+_LABEL_RE = re.compile('(?=(' + '|'.join(re.escape(key) for key in sorted(LABEL_MAP, key=len, reverse=True)) + '))')
+_LABEL_PRIORITY = {key: priority for priority, key in enumerate(LABEL_MAP)}
+_CLEAN_RE = re.compile(r'[^a-zA-Z0-9 ]')
+# str.translate table deleting every Latin-1 character _CLEAN_RE would strip
+_CLEAN_TABLE = {c: None for c in range(256) if chr(c) not in string.ascii_letters + string.digits + ' '}
+
+def clean_label(label_text: str) -> str:
+    clean = label_text.translate(_CLEAN_TABLE)
+    if not clean.isascii():
+        # Characters beyond Latin-1 are rare; let the regex strip those
+        clean = _CLEAN_RE.sub('', clean)
+    return clean.strip().lower()
 
 async def fill_information_page(page: Page, user_data: dict, log_path: str):
     log = {'inputs': [], 'dropdowns': [], 'checkboxes': []}
     # How did you hear about us
     try:
-        await page.wait_for_selector('div[data-automation-id="formField-source"] div[data-automation-id="multiselectInputContainer"]', timeout=15000)
-        how_did_you_hear_selector = page.locator('div[data-automation-id="formField-source"] div[data-automation-id="multiselectInputContainer"]')
+        how_did_you_hear_selector = page.locator(f'div[data-automation-id="formField-source"] {MULTISELECT_INPUT}')
+        await how_did_you_hear_selector.wait_for(timeout=15000)
         await how_did_you_hear_selector.click()
-        prompt_options = await page.query_selector_all('[data-automation-id="promptLeafNode"]')
-        if prompt_options:
-            await prompt_options[0].click()
+        prompt_option = page.locator(PROMPT_LEAF).first
+        await prompt_option.wait_for(timeout=5000)
+        await prompt_option.click()
         log['dropdowns'].append('how_did_you_hear')
     except Exception as e:
         log['dropdowns'].append({'how_did_you_hear': 'not found or not clickable', 'error': str(e)})
     # Country
-    country_button = await page.query_selector('button[aria-haspopup="listbox"][id*="country"]')
+    country_button = await page.query_selector(f'{LISTBOX_BUTTON}[id*="country"]')
     if country_button:
         await country_button.click()
-        options = await page.query_selector_all('div[visibility="opened"] li[role="option"]')
-        for option in options:
-            text = await option.text_content()
-        for option in options:
-            text = await option.text_content()
-            if text and "united states of america" in text.lower():
-                await option.click()
-                break
-        else:
-            if options:
-                await options[0].click()
+        # Match the option text in one evaluate call, falling back to the first option
+        try:
+            if not await click_option(page, OPENED_OPTION, "united states of america"):
+                await page.locator(OPENED_OPTION).first.click()
+        except Exception:
+            pass
         log['dropdowns'].append('country')
     # Phone device type
-    phone_type_button = await page.query_selector('div[data-automation-id="formField-phoneType"] button[aria-haspopup="listbox"]')
+    phone_type_button = await page.query_selector(f'div[data-automation-id="formField-phoneType"] {LISTBOX_BUTTON}')
     if phone_type_button:
         await phone_type_button.click()
-        options = await page.query_selector_all('div[visibility="opened"] li[role="option"]')
-        if options:
-            await options[1].click()
-        log['dropdowns'].append('phone_type')
+        second_option = page.locator(OPENED_OPTION).nth(1)
+        try:
+            await second_option.wait_for(timeout=5000)
+            await second_option.click()
+            log['dropdowns'].append('phone_type')
+        except Exception as e:
+            log['dropdowns'].append({'phone_type': 'option not found or not clickable', 'error': str(e)})
     # Country Phone Code
-    phone_device = page.locator('div[data-automation-id="formField-countryPhoneCode"] div[data-automation-id="multiselectInputContainer"]')
+    phone_device = page.locator(f'div[data-automation-id="formField-countryPhoneCode"] {MULTISELECT_INPUT}')
     await phone_device.click()
-    input_elem = phone_device.locator('input[placeholder="Search"]')
+    input_elem = phone_device.locator(SEARCH_INPUT)
     await input_elem.fill('United States')
     await input_elem.press('Enter')
-    prompt_options = await page.query_selector_all('[data-automation-id="promptLeafNode"]')
-    if prompt_options:
-        await prompt_options[0].click()
-    log['dropdowns'].append('country_phone_code')
+    prompt_option = page.locator(PROMPT_LEAF).first
+    try:
+        await prompt_option.wait_for(timeout=5000)
+        await prompt_option.click()
+        log['dropdowns'].append('country_phone_code')
+    except Exception as e:
+        log['dropdowns'].append({'country_phone_code': 'option not found or not clickable', 'error': str(e)})
     # Text inputs
-    def get_nested(data, keys):
-        for k in keys:
-            if isinstance(data, dict):
-                data = data.get(k)
-            else:
-                return ""
-        return data if data is not None else ""
-    label_map = {
-        "given name": ["personal_information", "first_name"],
-        "first name": ["personal_information", "first_name"],
-        "family name": ["personal_information", "last_name"],
-        "last name": ["personal_information", "last_name"],
-        "address line 1": ["personal_information", "address", "street"],
-        "city": ["personal_information", "address", "city"],
-        "town": ["personal_information", "address", "city"],
-        "postal code": ["personal_information", "address", "zipcode"],
-        "zip": ["personal_information", "address", "zipcode"],
-        "phone number": ["personal_information", "phone"],
-        "extension": ["personal_information", "extension"],
-        "country": ["personal_information", "address", "country"],
-        "state": ["personal_information", "address", "state"]
-    }
-    inputs = await page.query_selector_all('div[data-automation-id="applyFlowMyInfoPage"] input[type="text"]')
-    for input_elem in inputs:
-        label_text = None
-        input_id = await input_elem.get_attribute('id')
-        if input_id:
-            label_elem = await page.query_selector(f'label[for="{input_id}"]')
-            if label_elem:
-                label_text = await label_elem.text_content()
-        if not label_text:
-            parent_label_handle = await input_elem.evaluate_handle('el => el.closest("label")')
-            parent_label = parent_label_handle.as_element() if parent_label_handle else None
-            if parent_label:
-                label_text = await parent_label.text_content()
+    text_inputs = page.locator(_TEXT_INPUTS)
+    input_labels = await text_inputs.evaluate_all(_INPUT_LABELS_JS)
+    values = user_data.get('_info_values') or info_values(user_data)
+    planned = []
+    planned_entries = []
+    for input_info in input_labels:
+        label_text = input_info['label']
         if not label_text:
             continue
-        label_text_clean = re.sub(r'[^a-zA-Z0-9 ]', '', label_text).strip().lower()
-        matched = False
-        for key, json_path in label_map.items():
-            if key in label_text_clean:
-                value = get_nested(user_data, json_path)
-                if value:
-                    await input_elem.fill(str(value))
-                    matched = True
-                    log['inputs'].append({'label': label_text.strip(), 'value': value})
-                    break
-        if not matched:
-            log['inputs'].append({'label': label_text.strip(), 'value': None})
+        entry = {'label': label_text.strip(), 'value': None}
+        log['inputs'].append(entry)
+        # Inputs are filled by id so a re-render between the two calls can't shift values; skip id-less ones
+        input_id = input_info['id']
+        if not input_id:
+            continue
+        # First key in LABEL_MAP order that occurs in the label and has a value
+        matched_keys = {match.group(1) for match in _LABEL_RE.finditer(clean_label(label_text))}
+        for key in sorted(matched_keys, key=_LABEL_PRIORITY.__getitem__):
+            value = values[key]
+            if value:
+                escaped_id = input_id.replace('\\', '\\\\').replace('"', '\\"')
+                planned.append((f'input[id="{escaped_id}"]', str(value)))
+                planned_entries.append((entry, value))
+                break
+    # Fill every matched input in one round-trip; only log values that were actually entered
+    found = await fill_fields(page, planned)
+    for (entry, value), present in zip(planned_entries, found):
+        if present:
+            entry['value'] = value
     # Checkboxes
     no_radio = await page.query_selector('input[name="candidateIsPreviousWorker"][type="radio"][value="false"]')
     if no_radio:
-        checked = await no_radio.is_checked()
-        if not checked:
-            await no_radio.check()
+        await ensure_checked(no_radio)
         log['checkboxes'].append('candidateIsPreviousWorker_no')
-    # Save and continue
-    save_and_continue_button = await page.locator('button[data-automation-id="pageFooterNextButton"]').click()
-    await page.wait_for_load_state('networkidle')
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+    await write_json_async(log_path, log)
+    await click_next(page, page.locator(_MY_INFO_PAGE))
@@ -0,0 +1,18 @@
+import asyncio
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_json(path: str, obj):
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+async def write_json_async(path: str, obj):
+    await asyncio.get_running_loop().run_in_executor(None, dump_json, path, obj)
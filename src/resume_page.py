@@ -1,11 +1,31 @@
 from playwright.async_api import Page
-import json
+import asyncio
+import functools
+import mimetypes
+import os
+from src.json_utils import write_json_async
+
+@functools.lru_cache(maxsize=None)
+def _read_resume(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
 
 async def upload_resume(page: Page, user_data: dict, log_path: str):
     log = {}
+    resume_path = (user_data.get('documents', {}).get('resume_path')
+                   or user_data.get('resume_path')
+                   or os.environ.get('RESUME_PATH'))
+    if not resume_path:
+        log['resume_uploaded'] = None
+        await write_json_async(log_path, log)
+        return
     file_input = page.locator('input[data-automation-id="file-upload-input-ref"]')
-    resume_path = '/Users/mjolnir/Downloads/Lin Mei_Experiened Level Software.pdf'
-    await file_input.set_input_files(resume_path)
+    # Read the file once per process and hand Playwright the bytes
+    resume_bytes = await asyncio.to_thread(_read_resume, resume_path)
+    await file_input.set_input_files(files=[{
+        'name': os.path.basename(resume_path),
+        'mimeType': mimetypes.guess_type(resume_path)[0] or 'application/pdf',
+        'buffer': resume_bytes
+    }])
     log['resume_uploaded'] = resume_path
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+    await write_json_async(log_path, log)
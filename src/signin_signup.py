@@ -1,43 +1,53 @@
 def load_user_data(path='data/user_profile.json'):
     with open(path, 'r') as f:
-        return json.load(f)
+        data = json.load(f)
+    # Precompute values the page handlers would otherwise derive on every call
+    data['_skills_flat'] = flatten_skills(data)
+    data['_info_values'] = info_values(data)
+    return data
 
 import json
 import asyncio
 from playwright.async_api import Page
+from src.browser_utils import ensure_checked, fill_fields
+from src.information_page import info_values
+from src.json_utils import write_json_async
+from src.skills_page import flatten_skills
 
-async def signin_signup(page: Page, user_data: dict, log_path: str):
+async def signin_signup(page: Page, user_data: dict, log_path: str, user_choice: int = None):
     log = {}
-    user_choice = int(input("Enter 1 for sign in or 2 for sign up: "))
+    if user_choice is None:
+        user_choice = int(user_data.get('auth_mode', 1))
     log['user_choice'] = user_choice
     email = user_data['personal_information']['email']
     password = user_data['personal_information']['password']
     log['email'] = email
     log['password'] = '***'
+    # goto only waits for the DOM; wait until Workday has rendered the auth form
+    await page.locator('button[data-automation-id="signInLink"], input[data-automation-id="email"]').first.wait_for(timeout=30000)
     if user_choice == 2:
         # Sign Up
-        email_input = await page.query_selector('input[data-automation-id="email"]')
-        password_input = await page.query_selector('input[data-automation-id="password"]')
-        verify_password_input = await page.query_selector('input[data-automation-id="verifyPassword"]')
-        checkbox = await page.query_selector('input[data-automation-id="createAccountCheckbox"]')
-        submit_btn = await page.query_selector('div[aria-label="Create Account"]')
+        await page.locator('input[data-automation-id="verifyPassword"]').wait_for(timeout=15000)
+        # Fill all three inputs in one round-trip; the result says which were found
+        email_input, password_input, verify_password_input = await fill_fields(page, [
+            ('input[data-automation-id="email"]', email),
+            ('input[data-automation-id="password"]', password),
+            ('input[data-automation-id="verifyPassword"]', password)
+        ])
+        # The lookups are independent, so issue them concurrently
+        checkbox, submit_btn = await asyncio.gather(
+            page.query_selector('input[data-automation-id="createAccountCheckbox"]'),
+            page.query_selector('div[aria-label="Create Account"]')
+        )
         log['elements'] = {
-            'email_input': bool(email_input),
-            'password_input': bool(password_input),
-            'verify_password_input': bool(verify_password_input),
+            'email_input': email_input,
+            'password_input': password_input,
+            'verify_password_input': verify_password_input,
             'checkbox': bool(checkbox),
             'submit_btn': bool(submit_btn)
         }
-        if email_input:
-            await email_input.fill(email)
-        if password_input:
-            await password_input.fill(password)
-        if verify_password_input:
-            await verify_password_input.fill(password)
         if checkbox:
-            checked = await checkbox.is_checked()
-            if not checked:
-                await checkbox.check()
+            await ensure_checked(checkbox)
         if submit_btn:
             await submit_btn.click()
     elif user_choice == 1:
@@ -46,20 +56,19 @@ async def signin_signup(page: Page, user_data: dict, log_path: str):
         sign_in_link = await page.query_selector(sign_in_link_selector)
         if sign_in_link:
             await sign_in_link.click()
-        email_input = await page.query_selector('input[data-automation-id="email"]')
-        password_input = await page.query_selector('input[data-automation-id="password"]')
+        # The Sign In button only exists on the sign-in form, so wait for it before filling
+        await page.locator('div[aria-label="Sign In"]').wait_for(timeout=15000)
+        email_input, password_input = await fill_fields(page, [
+            ('input[data-automation-id="email"]', email),
+            ('input[data-automation-id="password"]', password)
+        ])
         submit_btn = await page.query_selector('div[aria-label="Sign In"]')
         log['elements'] = {
             'sign_in_link': bool(sign_in_link),
-            'email_input': bool(email_input),
-            'password_input': bool(password_input),
+            'email_input': email_input,
+            'password_input': password_input,
             'submit_btn': bool(submit_btn)
         }
-        if email_input:
-            await email_input.fill(email)
-        if password_input:
-            await password_input.fill(password)
         if submit_btn:
             await submit_btn.click()
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+    await write_json_async(log_path, log)
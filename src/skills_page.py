@@ -1,21 +1,36 @@
 from playwright.async_api import Page
-import json
+from itertools import chain
+from src.constants import PROMPT_LEAF, SEARCH_INPUT
+from src.json_utils import write_json_async
+
+def flatten_skills(user_data: dict) -> list:
+    prof_skills = user_data.get('personal_information', {}).get('professional_info', {}).get('skills', [])
+    tech_skills = user_data.get('technical_skills', {})
+    # Order-preserving dedup: professional skills first, then technical skills as listed
+    return list(dict.fromkeys(chain(prof_skills, (s for v in tech_skills.values() if isinstance(v, list) for s in v))))
 
 async def fill_skills_page(page: Page, user_data: dict, log_path: str):
     log = {'skills': []}
+    skills_list = user_data.get('_skills_flat') or flatten_skills(user_data)
+    if not skills_list:
+        await write_json_async(log_path, log)
+        return
     skills_section = page.locator('div[role="group"][aria-labelledby="Skills-section"]')
-    skills_input = skills_section.locator('input[placeholder="Search"]')
+    skills_input = skills_section.locator(SEARCH_INPUT)
     await skills_input.click()
-    prof_skills = user_data.get('personal_information', {}).get('professional_info', {}).get('skills', [])
-    tech_skills = user_data.get('technical_skills', {})
-    skills_list = list(set(prof_skills + [s for v in tech_skills.values() for s in (v if isinstance(v, list) else [])]))
     for skill in skills_list[:2]:
         await skills_input.fill(skill)
         await skills_input.press("Enter")
-        skills = await page.query_selector_all('div[data-automation-id="promptLeafNode"]')
-        if skills:
-            await skills[0].click()
+        skill_option = page.locator(PROMPT_LEAF).first
+        try:
+            await skill_option.wait_for(timeout=5000)
+            await skill_option.click()
+        except Exception:
+            continue
         log['skills'].append(skill)
-        await page.wait_for_timeout(1500)
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+        # Let the prompt list close so the next search doesn't pick a stale result
+        try:
+            await skill_option.wait_for(state='detached', timeout=5000)
+        except Exception:
+            pass
+    await write_json_async(log_path, log)
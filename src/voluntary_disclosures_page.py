@@ -1,30 +1,41 @@
 from playwright.async_api import Page
-import json
 import random
+from src.browser_utils import click_next, ensure_checked
+from src.constants import LISTBOX_BUTTON, OPENED_OPTION
+from src.json_utils import write_json_async
 
 async def fill_voluntary_disclosures_page(page: Page, user_data: dict, log_path: str):
     log = {'listboxes': [], 'checkboxes': []}
+    page_container = page.locator('div[data-automation-id="applyFlowVoluntaryDisclosuresPage"]')
+    # Wait for the page to render; the previous page is swapped out in place
+    try:
+        await page_container.wait_for(timeout=15000)
+    except Exception:
+        pass
     section = await page.query_selector('div[data-automation-id="applyFlowVoluntaryDisclosuresPage"]')
     if section:
-        listboxes = await section.query_selector_all('button[aria-haspopup="listbox"]')
+        listboxes = await section.query_selector_all(LISTBOX_BUTTON)
+        options = page.locator(OPENED_OPTION)
         for i, listbox in enumerate(listboxes, 1):
             await listbox.click()
-            options = await page.query_selector_all('div[visibility="opened"] li[role="option"]')
-            if options:
-                random_option = random.choice(options)
-                option_text = await random_option.text_content()
-                await random_option.click()
-                log['listboxes'].append({'listbox': i, 'selected': option_text.strip() if option_text else ''})
-            await page.wait_for_timeout(3000)
+            try:
+                await page.wait_for_selector(OPENED_OPTION, timeout=5000)
+            except Exception:
+                pass
+            # Read every option's text in one call, then click the chosen one by index
+            option_texts = await options.evaluate_all('els => els.map(el => el.textContent || "")')
+            if option_texts:
+                index = random.randrange(len(option_texts))
+                await options.nth(index).click()
+                log['listboxes'].append({'listbox': i, 'selected': option_texts[index].strip()})
+                # Let the popup close so the next listbox doesn't read these options
+                try:
+                    await options.first.wait_for(state='detached', timeout=5000)
+                except Exception:
+                    pass
         checkboxes = await section.query_selector_all('input[type="checkbox"]')
         for j, checkbox in enumerate(checkboxes, 1):
-            checked = await checkbox.is_checked()
-            if not checked:
-                await checkbox.click()
+            await ensure_checked(checkbox)
             log['checkboxes'].append({'checkbox': j, 'checked': True})
-            await page.wait_for_timeout(2000)
-    save_and_continue = page.locator('button[data-automation-id="pageFooterNextButton"]')
-    await save_and_continue.click()
-    await page.wait_for_timeout(6000)
-    with open(log_path, 'w') as f:
-        json.dump(log, f, indent=2)
+    await write_json_async(log_path, log)
+    await click_next(page, page_container)